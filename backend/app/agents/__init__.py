@@ -1,8 +1,11 @@
 """Agents package for research agent."""
 
-from .research_agent import ResearchAgent
+from .deadline import Deadline
+from .research_agent import ResearchAgent, get_research_agent
 
 __all__ = [
+    "Deadline",
     "ResearchAgent",
+    "get_research_agent",
 ]
 
@@ -0,0 +1,38 @@
+"""Per-request time budget tracking for the research workflow."""
+
+import time
+from typing import Optional
+
+
+class Deadline:
+    """
+    Tracks how much of a research request's time budget is left.
+
+    Stages are given checkpoints as fractions of the total budget, so a slow
+    search leaves less time for extraction instead of pushing synthesis past
+    the deadline. An unbounded deadline (no budget) never expires.
+    """
+
+    def __init__(self, budget_seconds: Optional[float] = None):
+        self.budget = budget_seconds
+        self.started_at = time.monotonic()
+
+    @property
+    def bounded(self) -> bool:
+        return self.budget is not None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left in the whole budget (None if unbounded)."""
+        return self.until(1.0)
+
+    def until(self, fraction: float) -> Optional[float]:
+        """Seconds left until `fraction` of the budget has elapsed (None if unbounded)."""
+        if self.budget is None:
+            return None
+        checkpoint = self.started_at + self.budget * fraction
+        return max(0.0, checkpoint - time.monotonic())
+
+    def expired(self, fraction: float = 1.0) -> bool:
+        """Whether the checkpoint at `fraction` of the budget has passed."""
+        left = self.until(fraction)
+        return left is not None and left <= 0.0
@@ -0,0 +1,44 @@
+"""Near-duplicate detection for extracted page content.
+
+Syndicated articles and mirrored pages are fingerprinted with a bottom-k
+MinHash sketch over word shingles, and two pages are near-duplicates when
+their estimated Jaccard similarity is above a threshold.
+"""
+
+import hashlib
+import heapq
+import re
+
+# Words per shingle, and hashes kept per sketch
+SHINGLE_SIZE = 4
+SKETCH_SIZE = 128
+
+# Texts with fewer shingles than this (snippets, error stubs) are not compared
+MIN_SHINGLES = 32
+
+_WORD = re.compile(r"\w+")
+
+Fingerprint = frozenset[int]
+
+
+def fingerprint(text: str) -> Fingerprint:
+    """Bottom-k MinHash sketch: the SKETCH_SIZE smallest 64-bit shingle hashes."""
+    words = _WORD.findall(text.lower())
+    shingles = {
+        " ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)
+    }
+    if len(shingles) < MIN_SHINGLES:
+        return frozenset()
+    hashes = (
+        int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big")
+        for shingle in shingles
+    )
+    return frozenset(heapq.nsmallest(SKETCH_SIZE, hashes))
+
+
+def similarity(a: Fingerprint, b: Fingerprint) -> float:
+    """Estimated Jaccard similarity of the texts behind two fingerprints."""
+    if not a or not b:
+        return 0.0
+    union = heapq.nsmallest(SKETCH_SIZE, a | b)
+    return sum(1 for h in union if h in a and h in b) / len(union)
@@ -1,12 +1,24 @@
 """Main research agent orchestrating the research workflow."""
 
+import asyncio
 import time
-from typing import AsyncGenerator
+import uuid
+from typing import AsyncGenerator, Awaitable, Callable, Optional
+from urllib.parse import urlparse
 
 from langchain_core.language_models import BaseChatModel
 
-from app.chains import SummarizerChain, SynthesizerChain
-from app.models import ResearchProgress, ResearchResult, ResearchStatus, Source
+from app.agents.deadline import Deadline
+from app.agents.dedup import fingerprint, similarity
+from app.agents.relevance import rank_sources
+from app.cache import get_failure_cache, get_summary_cache
+from app.chains import QueryExpanderChain, SummarizerChain, SynthesizerChain
+from app.config import get_settings
+from app.llm import get_llm
+from app.llm_scheduler import prioritize
+from app.metrics import DUPLICATE_SOURCES, ERRORS, RESEARCH_LATENCY, STAGE_LATENCY, TIMEOUTS
+from app.models import BriefingDelta, ResearchProgress, ResearchResult, ResearchStatus, Source
+from app.request_context import run_owner
 from app.tools import (
     AcademicSearchTool,
     ContentExtractorTool,
@@ -14,15 +26,37 @@ from app.tools import (
     WebSearchTool,
 )
 
+# Checkpoints, as fractions of a request's time budget, by which each stage
+# must finish. Whatever is left after SUMMARIZE_BY is reserved for synthesis.
+SEARCH_BY = 0.2
+EXTRACT_BY = 0.45
+SUMMARIZE_BY = 0.65
+
+# Upper bound on the LLM call that plans deep-research sub-queries
+QUERY_EXPANSION_TIMEOUT = 15.0
+
+# Below this many seconds an LLM summary is skipped in favour of the snippet
+MIN_SUMMARY_SECONDS = 3.0
+
+# Display names for search backends, keyed by metrics stage name
+SEARCH_BACKEND_LABELS = {
+    "search": "Web search",
+    "academic_search": "Academic search",
+}
+
 
 class ResearchAgent:
     """
     Orchestrates the research workflow:
-    1. Search for sources (web + optional academic)
-    2. Filter by credibility
+    1. Search for sources (web + optional academic; several sub-queries in deep mode)
+    2. Filter by credibility, rank by topic relevance and credibility
     3. Extract content
     4. Summarize each source
     5. Synthesize into briefing
+
+    A single agent is shared by all requests (see `get_research_agent`), so
+    `research()` keeps all per-request state local and takes per-request
+    overrides as arguments.
     """
 
     def __init__(
@@ -30,27 +64,354 @@ class ResearchAgent:
         llm: BaseChatModel,
         max_sources: int = 5,
         min_credibility: float = 0.4,
+        extraction_hedge: int = 2,
+        deep_subqueries: int = 3,
+        search_concurrency: int = 4,
+        extraction_engine: str = "readability",
+        max_download_bytes: int = 2_000_000,
+        max_content_chars: int = 100_000,
+        duplicate_threshold: float = 0.8,
+        relevance_weight: float = 0.5,
+        summarizer: Optional[SummarizerChain] = None,
     ):
         self.llm = llm
         self.max_sources = max_sources
         self.min_credibility = min_credibility
+        self.extraction_hedge = extraction_hedge  # Extra candidates extracted per request
+        self.deep_subqueries = deep_subqueries  # Extra search queries in deep mode
+        self.search_concurrency = search_concurrency  # Searches in flight per request
+        self.duplicate_threshold = duplicate_threshold  # Similarity at which pages are duplicates
+        self.relevance_weight = relevance_weight  # Share of topic relevance in candidate ranking
 
         # Initialize tools
         self.search_tool = WebSearchTool(max_results=max_sources * 2)
         self.academic_search_tool = AcademicSearchTool(max_results=max_sources)
-        self.extractor_tool = ContentExtractorTool()
+        self.extractor_tool = ContentExtractorTool(
+            engine=extraction_engine,
+            max_download_bytes=max_download_bytes,
+            max_content_length=max_content_chars,
+        )
         self.credibility_tool = CredibilityFilterTool(min_credibility=min_credibility)
 
-        # Initialize chains
-        self.summarizer = SummarizerChain(llm)
-        self.synthesizer = SynthesizerChain(llm)
+        # Initialize chains (the briefing a user waits on is scheduled before summaries)
+        self.query_expander = QueryExpanderChain(prioritize(llm, "query_expansion"))
+        self.summarizer = summarizer or SummarizerChain(prioritize(llm, "summary"))
+        self.synthesizer = SynthesizerChain(prioritize(llm, "synthesis"))
+
+    @staticmethod
+    def _needs_extraction(url: str) -> bool:
+        """Academic sources (arXiv) already carry the abstract in their snippet."""
+        return not any(domain in url for domain in ["arxiv.org", "semanticscholar.org"])
+
+    @staticmethod
+    async def _search_backends(
+        queries: list[str],
+        backends: dict[str, Callable[[str], Awaitable[list[Source]]]],
+        timeout: Optional[float] = None,
+        max_concurrent: Optional[int] = None,
+        more_queries: Optional[Awaitable[list[str]]] = None,
+    ) -> AsyncGenerator[tuple[str, str, list[Source], float], None]:
+        """
+        Run every query against every search backend concurrently.
+
+        Backends are keyed by their metrics stage name. At most
+        `max_concurrent` searches are in flight at once, and a search that does
+        not finish within `timeout` seconds of the start (including time spent
+        waiting for a slot) contributes no results. Queries returned by
+        `more_queries` are appended to `queries` and searched as soon as they
+        arrive, while the first searches are already running.
+
+        Yields:
+            (backend name, query, sources, elapsed seconds) in completion order
+        """
+        start_time = time.time()
+        semaphore = asyncio.Semaphore(max_concurrent) if max_concurrent else None
+
+        async def guarded(name: str, search, query: str) -> list[Source]:
+            if semaphore is None:
+                with STAGE_LATENCY.time(stage=name):
+                    return await search(query)
+            async with semaphore:
+                with STAGE_LATENCY.time(stage=name):
+                    return await search(query)
+
+        async def run(name: str, search, query: str) -> tuple[str, str, list[Source], float]:
+            time_left = None if timeout is None else max(0.0, start_time + timeout - time.time())
+            try:
+                found = await asyncio.wait_for(guarded(name, search, query), timeout=time_left)
+            except asyncio.TimeoutError:
+                print(f"⚠️ {SEARCH_BACKEND_LABELS.get(name, name)} exceeded the time budget")
+                TIMEOUTS.inc(target=f"{name}_budget")
+                found = []
+            except Exception as e:
+                print(f"❌ {SEARCH_BACKEND_LABELS.get(name, name)} failed: {type(e).__name__}: {str(e)}")
+                ERRORS.inc(stage=name)
+                found = []
+            return name, query, found, time.time() - start_time
+
+        def start(new_queries: list[str]) -> set[asyncio.Task]:
+            return {
+                asyncio.create_task(run(name, search, query))
+                for name, search in backends.items()
+                for query in new_queries
+            }
+
+        pending = start(queries)
+        expansion = asyncio.ensure_future(more_queries) if more_queries is not None else None
+        if expansion is not None:
+            pending.add(expansion)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for completed in done:
+                    if completed is expansion:
+                        new_queries = [q for q in completed.result() if q not in queries]
+                        queries.extend(new_queries)
+                        pending |= start(new_queries)
+                    else:
+                        yield completed.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    def _url_key(url: str) -> tuple[str, str, str]:
+        """URL identity for deduplication: host without www, path without trailing slash, query."""
+        parsed = urlparse(url.strip())
+        host = parsed.netloc.lower().removeprefix("www.")
+        return host, parsed.path.rstrip("/"), parsed.query
+
+    @classmethod
+    def _dedupe_sources(cls, sources: list[Source]) -> list[Source]:
+        """Drop sources whose URL was already seen, keeping the first occurrence."""
+        seen = set()
+        unique = []
+        for source in sources:
+            key = cls._url_key(source.url)
+            if key not in seen:
+                seen.add(key)
+                unique.append(source)
+        return unique
+
+    async def _expand_queries(self, topic: str, deadline: Deadline) -> list[str]:
+        """Generate deep-research sub-queries, giving up quietly on failure."""
+        timeout = QUERY_EXPANSION_TIMEOUT
+        budget_left = deadline.until(SEARCH_BY / 2)
+        if budget_left is not None:
+            timeout = min(timeout, budget_left)
+
+        try:
+            with STAGE_LATENCY.time(stage="query_expansion"):
+                return await asyncio.wait_for(
+                    self.query_expander.expand(topic, count=self.deep_subqueries),
+                    timeout=timeout,
+                )
+        except asyncio.TimeoutError:
+            TIMEOUTS.inc(target="query_expansion")
+        except Exception as e:
+            print(f"❌ Query expansion failed: {type(e).__name__}: {str(e)}")
+            ERRORS.inc(stage="query_expansion")
+        return []
+
+    async def _process_sources(
+        self,
+        topic: str,
+        candidates: list[Source],
+        target: int,
+        selected: list[Source],
+        sources_found: int,
+        deadline: Deadline,
+        shed: dict[str, int],
+    ) -> AsyncGenerator[ResearchProgress, None]:
+        """
+        Extract and summarize sources as a streaming pipeline.
+
+        Each source is summarized as soon as its own extraction completes
+        instead of waiting for the whole batch. Extraction is hedged: it starts
+        on every candidate at once (the fetch scheduler limits the load), the
+        first `target` pages that extract successfully are kept, and the
+        stragglers are cancelled.
+        Pages that are near-duplicates of a kept page (syndicated or mirrored
+        copies) are not summarized twice: the higher-ranked copy is kept and
+        the slot stays open for the remaining candidates.
+        If fewer than `target` succeed, failed candidates are backfilled with
+        their search snippet. The kept sources, in rank order, are
+        appended to `selected` and updated in place with content and summary.
+
+        When the deadline's extraction checkpoint passes, pages still being
+        extracted count as failed (and may be backfilled with their snippet);
+        when the summarization checkpoint passes, the remaining summaries fall
+        back to the snippet. The number of shed sources is counted in `shed`.
+
+        Yields:
+            A progress update each time a source is extracted, skipped or summarized
+        """
+        target = min(target, len(candidates))
+        if target == 0:
+            return
+
+        events: asyncio.Queue = asyncio.Queue()
+        kept: list[Source] = []
+        failed: list[Source] = []
+        tasks: dict[int, asyncio.Task] = {}
+        rank = {id(source): index for index, source in enumerate(candidates)}
+        prints = {}
+        timed_out: set[int] = set()  # Candidates cut off by the extraction checkpoint
+
+        async def extract(url: str) -> str:
+            with STAGE_LATENCY.time(stage="extract"):
+                return await self.extractor_tool.extract(url)
+
+        async def summarize(source: Source) -> str:
+            with STAGE_LATENCY.time(stage="summarize"):
+                return await self.summarizer.summarize(
+                    topic=topic,
+                    title=source.title,
+                    url=source.url,
+                    content=source.content or source.snippet,
+                )
+
+        async def process(index: int, source: Source) -> None:
+            stage = "extract"
+            try:
+                if self._needs_extraction(source.url):
+                    try:
+                        source.content = await asyncio.wait_for(
+                            extract(source.url), timeout=deadline.until(EXTRACT_BY)
+                        )
+                        if source.content.startswith("[Error"):
+                            ERRORS.inc(stage="extract")
+                    except asyncio.TimeoutError:
+                        # Out of time: a failure, which the snippet may backfill later
+                        TIMEOUTS.inc(target="extract_budget")
+                        timed_out.add(id(source))
+                        source.content = None
+                elif not source.content:
+                    # For academic sources, use the snippet as content
+                    source.content = source.snippet
+
+                if not source.content or source.content.startswith("[Error"):
+                    failed.append(source)
+                    await events.put(("failed", source, None))
+                    return
+                if len(kept) >= target:
+                    await events.put(("surplus", source, None))
+                    return
+
+                prints[id(source)] = fingerprint(source.content)
+                original = next(
+                    (
+                        other for other in kept
+                        if similarity(prints[id(source)], prints[id(other)])
+                        >= self.duplicate_threshold
+                    ),
+                    None,
+                )
+                if original is not None:
+                    DUPLICATE_SOURCES.inc()
+                    if rank[id(source)] > rank[id(original)] or original.summary is not None:
+                        await events.put(("duplicate", source, original))
+                        return
+                    # This copy ranks higher: it takes over the slot (and
+                    # the summarization) of the copy kept earlier
+                    kept[kept.index(original)] = source
+                    tasks[rank[id(original)]].cancel()
+                    await events.put(("replaced", source, original))
+                else:
+                    kept.append(source)
+                    if len(kept) == target:
+                        # Enough good pages: stop waiting on the stragglers
+                        kept_ranks = {rank[id(s)] for s in kept}
+                        for other, task in tasks.items():
+                            if other not in kept_ranks:
+                                task.cancel()
+                    await events.put(("extracted", source, None))
+
+                stage = "summarize"
+                time_left = deadline.until(SUMMARIZE_BY)
+                summary = None
+                if time_left is None or time_left >= MIN_SUMMARY_SECONDS:
+                    try:
+                        summary = await asyncio.wait_for(summarize(source), timeout=time_left)
+                    except asyncio.TimeoutError:
+                        pass
+                if summary is None:
+                    # Not enough time for an LLM call: pass the snippet through
+                    TIMEOUTS.inc(target="summarize_budget")
+                    shed["summarize"] += 1
+                    summary = source.snippet
+                source.summary = summary
+                await events.put(("summarized", source, None))
+            except Exception as e:
+                ERRORS.inc(stage=stage)
+                await events.put(("error", source, e))
+
+        for index, source in enumerate(candidates):
+            tasks[index] = asyncio.create_task(process(index, source))
+
+        resolved = 0
+        extracted = 0
+        summarized = 0
+
+        try:
+            while summarized < len(kept) or (len(kept) < target and resolved < len(candidates)):
+                kind, source, detail = await events.get()
+                if kind == "error":
+                    raise detail
+
+                if kind in ("duplicate", "replaced"):
+                    resolved += 1
+                    status = ResearchStatus.EXTRACTING
+                    if kind == "duplicate":
+                        message = f"Skipped {source.title}: duplicate of {detail.title}"
+                    else:
+                        message = f"Replaced {detail.title} with a higher-ranked copy: {source.title}"
+                elif kind in ("failed", "surplus"):
+                    resolved += 1
+                    if kind == "surplus" or len(kept) >= target:
+                        continue
+                    status = ResearchStatus.EXTRACTING
+                    message = f"Skipped {source.title}: content extraction failed"
+                elif kind == "extracted":
+                    resolved += 1
+                    extracted += 1
+                    status = ResearchStatus.EXTRACTING
+                    message = f"Extracted {extracted}/{target}: {source.title}"
+                else:
+                    summarized += 1
+                    status = ResearchStatus.SUMMARIZING
+                    message = f"Summarized {summarized}/{target}: {source.title}"
+
+                yield ResearchProgress(
+                    status=status,
+                    message=message,
+                    progress=round(0.3 + 0.5 * (extracted + summarized) / (2 * target), 3),
+                    sources_found=sources_found,
+                    sources_processed=summarized,
+                )
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+        # Too few pages extracted: fall back to snippets of the best failures
+        backfill = sorted(failed, key=lambda s: rank[id(s)])[: target - len(kept)]
+        shed["extract"] += sum(1 for source in backfill if id(source) in timed_out)
+        for source in backfill:
+            source.content = source.snippet
+            source.summary = source.snippet
+
+        selected.extend(sorted(kept + backfill, key=lambda s: rank[id(s)]))
 
     async def research(
         self,
         topic: str,
         depth: str = "standard",
         include_academic: bool = False,
-    ) -> AsyncGenerator[ResearchProgress | ResearchResult, None]:
+        stream_briefing: bool = False,
+        max_sources: Optional[int] = None,
+        min_credibility: Optional[float] = None,
+        time_budget: Optional[float] = None,
+    ) -> AsyncGenerator[ResearchProgress | BriefingDelta | ResearchResult, None]:
         """
         Execute research workflow with streaming progress updates.
 
@@ -58,18 +419,31 @@ class ResearchAgent:
             topic: The research topic
             depth: Research depth (quick, standard, deep)
             include_academic: Whether to include academic sources (arXiv, Semantic Scholar)
+            stream_briefing: Whether to yield briefing deltas while it is synthesized
+            max_sources: Override the agent's default source count for this request
+            min_credibility: Override the agent's credibility threshold for this request
+            time_budget: Seconds the whole run may take. Stages shed work (snippets
+                instead of pages or summaries, a summary-only briefing) to finish
+                on time, and the result is marked `degraded`.
 
         Yields:
-            Progress updates and final result
+            Progress updates, briefing deltas (if streaming) and final result
         """
         start_time = time.time()
+        deadline = Deadline(time_budget)
+        run_owner.set(uuid.uuid4().hex)  # Fair-queuing identity for fetches and LLM calls
+        shed = {"search": 0, "extract": 0, "summarize": 0, "synthesize": 0}
+
+        base_sources = max_sources or self.max_sources
+        if min_credibility is None:
+            min_credibility = self.min_credibility
 
         # Adjust parameters based on depth
         max_sources = {
             "quick": 3,
-            "standard": self.max_sources,
-            "deep": self.max_sources + 3,
-        }.get(depth, self.max_sources)
+            "standard": base_sources,
+            "deep": base_sources + 3,
+        }.get(depth, base_sources)
 
         # Step 1: Search
         search_message = f"Searching for sources on: {topic}"
@@ -82,12 +456,62 @@ class ResearchAgent:
             progress=0.1,
         )
 
-        # Perform web search
-        sources = await self.search_tool.search(topic)
-        
-        # Debug logging
+        # Deep research fans out over several sub-queries, searched as soon as
+        # the LLM returns them while the topic itself is already being searched
+        queries = [topic]
+        more_queries = None
+        if depth == "deep" and self.deep_subqueries > 0:
+            yield ResearchProgress(
+                status=ResearchStatus.SEARCHING,
+                message="Planning sub-queries for deep research...",
+                progress=0.1,
+            )
+            more_queries = self._expand_queries(topic, deadline)
+
+        # Fan out to all enabled search backends at once
+        backends = {"search": self.search_tool.search}
+        if include_academic:
+            backends["academic_search"] = self.academic_search_tool.search
+
+        results: dict[tuple[str, str], list[Source]] = {}
+        found_urls: set[tuple[str, str, str]] = set()
+        search_progress = 0.1
+        async for name, query, backend_sources, elapsed in self._search_backends(
+            queries,
+            backends,
+            timeout=deadline.until(SEARCH_BY),
+            max_concurrent=self.search_concurrency,
+            more_queries=more_queries,
+        ):
+            if deadline.expired(SEARCH_BY):
+                shed["search"] += 1
+            results[(name, query)] = backend_sources
+            # Count distinct URLs, as kept after the merge below, so the count never drops
+            found_urls.update(self._url_key(source.url) for source in backend_sources)
+            # Sub-queries arriving later grow the total, so progress never goes back
+            search_progress = max(
+                search_progress,
+                round(0.1 + 0.1 * len(results) / (len(backends) * len(queries)), 3),
+            )
+            label = SEARCH_BACKEND_LABELS[name]
+            if len(queries) > 1:
+                label = f"{label} ('{query}')"
+            print(f"✓ {label} found {len(backend_sources)} sources in {elapsed:.2f}s")
+            yield ResearchProgress(
+                status=ResearchStatus.SEARCHING,
+                message=f"{label} returned {len(backend_sources)} sources in {elapsed:.1f}s",
+                progress=search_progress,
+                sources_found=len(found_urls),
+            )
+
+        # Merge in backend then query order so web results for the original
+        # topic keep precedence on ties, dropping duplicate URLs
+        sources = self._dedupe_sources([
+            s for name in backends for query in queries for s in results.get((name, query), [])
+        ])
+
         if not sources:
-            print(f"⚠️ WARNING: Web search returned 0 sources for: {topic}")
+            print(f"⚠️ WARNING: Search returned 0 sources for: {topic}")
             yield ResearchProgress(
                 status=ResearchStatus.ERROR,
                 message=f"Search failed: No sources found for '{topic}'. Please try a different query.",
@@ -96,20 +520,6 @@ class ResearchAgent:
             )
             return
 
-        print(f"✓ Web search found {len(sources)} sources")
-        
-        # Add academic sources if requested
-        if include_academic:
-            yield ResearchProgress(
-                status=ResearchStatus.SEARCHING,
-                message="Searching academic databases (arXiv, Semantic Scholar)...",
-                progress=0.15,
-                sources_found=len(sources),
-            )
-            
-            academic_sources = await self.academic_search_tool.search(topic)
-            sources.extend(academic_sources)
-
         yield ResearchProgress(
             status=ResearchStatus.SEARCHING,
             message=f"Found {len(sources)} potential sources",
@@ -117,97 +527,128 @@ class ResearchAgent:
             sources_found=len(sources),
         )
 
-        # Step 2: Filter by credibility
-        filtered_sources = self.credibility_tool.filter_sources(
-            sources, min_score=self.min_credibility
-        )
+        # Step 2: Filter by credibility, skipping pages on hosts known to be down
+        failures = get_failure_cache()
+
+        def unreachable(source: Source) -> bool:
+            return self._needs_extraction(source.url) and failures.is_open(source.url)
 
-        # If all filtered out, lower threshold
-        if not filtered_sources:
-            print(f"⚠️ WARNING: All {len(sources)} sources filtered out by credibility (min={self.min_credibility})")
+        with STAGE_LATENCY.time(stage="credibility"):
             filtered_sources = self.credibility_tool.filter_sources(
-                sources, min_score=0.2  # Lower threshold
+                sources, min_score=min_credibility, skip=unreachable
             )
-            print(f"✓ After lowering threshold: {len(filtered_sources)} sources passed")
 
-        # Limit to max sources
-        filtered_sources = filtered_sources[:max_sources]
+            # If all filtered out, lower threshold
+            if not filtered_sources:
+                print(f"⚠️ WARNING: All {len(sources)} sources filtered out by credibility (min={min_credibility})")
+                filtered_sources = self.credibility_tool.filter_sources(
+                    sources, min_score=0.2, skip=unreachable  # Lower threshold
+                )
+                print(f"✓ After lowering threshold: {len(filtered_sources)} sources passed")
+
+            # Prefer on-topic pages among the credible ones before anything is fetched
+            filtered_sources = rank_sources(topic, filtered_sources, self.relevance_weight)
+
+        # Over-fetch a few extra candidates to hedge against failed pages
+        candidates = filtered_sources[:max_sources + self.extraction_hedge]
 
         yield ResearchProgress(
             status=ResearchStatus.EXTRACTING,
-            message=f"Processing {len(filtered_sources)} credible sources",
+            message=f"Processing {min(max_sources, len(candidates))} credible sources",
             progress=0.3,
             sources_found=len(sources),
             sources_processed=0,
         )
 
-        # Step 3: Extract content
-        # For academic sources (arXiv), the snippet already contains the abstract
-        # so we only extract content for non-academic URLs
-        web_urls = [
-            s.url for s in filtered_sources 
-            if not any(domain in s.url for domain in ["arxiv.org", "semanticscholar.org"])
-        ]
-        
-        content_map = await self.extractor_tool.extract_batch(web_urls) if web_urls else {}
-
-        # Update sources with content
-        for source in filtered_sources:
-            if source.url in content_map:
-                source.content = content_map.get(source.url, "")
-            elif not source.content:
-                # For academic sources, use the snippet as content if no content extracted
-                source.content = source.snippet
-
-        yield ResearchProgress(
-            status=ResearchStatus.SUMMARIZING,
-            message="Summarizing sources...",
-            progress=0.5,
+        # Steps 3-4: Extract and summarize as a pipeline, so each source
+        # reaches the summarizer as soon as its own page has been fetched
+        selected_sources = []
+        async for progress in self._process_sources(
+            topic=topic,
+            candidates=candidates,
+            target=max_sources,
+            selected=selected_sources,
             sources_found=len(sources),
-            sources_processed=len(filtered_sources),
-        )
+            deadline=deadline,
+            shed=shed,
+        ):
+            yield progress
+
+        if shed["extract"] or shed["summarize"]:
+            yield ResearchProgress(
+                status=ResearchStatus.SUMMARIZING,
+                message=(
+                    f"Time budget: used search snippets for {shed['extract']} pages "
+                    f"and {shed['summarize']} summaries"
+                ),
+                progress=0.8,
+                sources_found=len(sources),
+                sources_processed=len(selected_sources),
+            )
 
-        # Step 4: Summarize each source
-        sources_for_summary = [
+        summarized_sources = [
             {
                 "url": s.url,
                 "title": s.title,
                 "content": s.content or s.snippet,
                 "credibility_score": s.credibility_score,
+                "summary": s.summary or "",
             }
-            for s in filtered_sources
+            for s in selected_sources
         ]
 
-        summarized_sources = await self.summarizer.summarize_batch(
-            topic=topic,
-            sources=sources_for_summary,
-        )
-
-        # If summarization failed, use original sources
-        if not summarized_sources:
-            print(f"⚠️ WARNING: Summarization returned 0 sources")
-            summarized_sources = sources_for_summary
-
-        # Update source objects with summaries
-        for i, source in enumerate(filtered_sources):
-            if i < len(summarized_sources):
-                source.summary = summarized_sources[i].get("summary", "")
-
         yield ResearchProgress(
             status=ResearchStatus.SYNTHESIZING,
             message="Synthesizing research briefing...",
             progress=0.8,
             sources_found=len(sources),
-            sources_processed=len(filtered_sources),
+            sources_processed=len(selected_sources),
         )
 
         # Step 5: Synthesize briefing
-        briefing = await self.synthesizer.synthesize(
-            topic=topic,
-            sources=summarized_sources,
-        )
+        synthesize_start = time.perf_counter()
+        if stream_briefing:
+            chunks = []
+            stream = self.synthesizer.synthesize_stream(
+                topic=topic,
+                sources=summarized_sources,
+            )
+            try:
+                while True:
+                    try:
+                        delta = await asyncio.wait_for(anext(stream), timeout=deadline.remaining())
+                    except StopAsyncIteration:
+                        break
+                    chunks.append(delta)
+                    yield BriefingDelta(delta=delta)
+            except asyncio.TimeoutError:
+                shed["synthesize"] += 1
+            finally:
+                await stream.aclose()
+
+            if shed["synthesize"] and chunks:
+                chunks.append("\n\n*[Briefing cut short: time budget exhausted]*")
+            if shed["synthesize"] and not chunks:
+                briefing = self.synthesizer.fallback_briefing(topic, summarized_sources)
+            else:
+                briefing = self.synthesizer.finalize("".join(chunks), summarized_sources)
+        else:
+            try:
+                briefing = await asyncio.wait_for(
+                    self.synthesizer.synthesize(topic=topic, sources=summarized_sources),
+                    timeout=deadline.remaining(),
+                )
+            except asyncio.TimeoutError:
+                shed["synthesize"] += 1
+                briefing = self.synthesizer.fallback_briefing(topic, summarized_sources)
+
+        if shed["synthesize"]:
+            TIMEOUTS.inc(target="synthesize_budget")
+
+        STAGE_LATENCY.observe(time.perf_counter() - synthesize_start, stage="synthesize")
 
         total_time = time.time() - start_time
+        RESEARCH_LATENCY.observe(total_time, depth=depth)
 
         # Final result
         yield ResearchProgress(
@@ -215,13 +656,50 @@ class ResearchAgent:
             message="Research complete!",
             progress=1.0,
             sources_found=len(sources),
-            sources_processed=len(filtered_sources),
+            sources_processed=len(selected_sources),
         )
 
         yield ResearchResult(
             topic=topic,
             briefing=briefing,
-            sources=filtered_sources,
+            sources=selected_sources,
             total_time_seconds=round(total_time, 2),
+            degraded=any(shed.values()),
             model_used=str(self.llm.model_name if hasattr(self.llm, "model_name") else "unknown"),
-        )
\ No newline at end of file
+        )
+
+
+# Singleton agent instance
+_agent_instance: Optional[ResearchAgent] = None
+
+
+def get_research_agent() -> ResearchAgent:
+    """Get the shared research agent, building it on first use."""
+    global _agent_instance
+    if _agent_instance is None:
+        settings = get_settings()
+        _agent_instance = ResearchAgent(
+            llm=get_llm(),
+            max_sources=settings.max_sources_to_process,
+            min_credibility=0.4,
+            extraction_hedge=settings.extraction_hedge,
+            deep_subqueries=settings.deep_research_subqueries,
+            search_concurrency=settings.search_max_concurrency,
+            extraction_engine=settings.extraction_engine,
+            max_download_bytes=settings.extraction_max_download_bytes,
+            max_content_chars=settings.extraction_max_content_chars,
+            duplicate_threshold=settings.duplicate_similarity_threshold,
+            relevance_weight=settings.relevance_weight,
+            summarizer=SummarizerChain(
+                llm=prioritize(get_llm(), "summary"),
+                mode=settings.summarize_mode,
+                chunk_tokens=settings.summarize_chunk_tokens,
+                max_content_tokens=settings.summarize_max_content_tokens,
+                chunk_summary_tokens=settings.summarize_chunk_summary_tokens,
+                reduce_input_tokens=settings.summarize_reduce_input_tokens,
+                reduce_output_tokens=settings.summarize_reduce_output_tokens,
+                max_concurrency=settings.summarize_max_concurrency,
+                cache=get_summary_cache(),
+            ),
+        )
+    return _agent_instance
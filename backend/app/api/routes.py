@@ -6,7 +6,7 @@ from io import BytesIO
 from typing import AsyncGenerator, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import StreamingResponse
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from sqlalchemy import func, select
@@ -14,22 +14,38 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sse_starlette.sse import EventSourceResponse
 
-from app.agents import ResearchAgent
+from app.agents import get_research_agent
 from app.auth import get_current_user_id, get_optional_user_id
-from app.cache import get_cache
+from app.cache import (
+    get_cache,
+    get_content_store,
+    get_failure_cache,
+    get_single_flight,
+    get_summary_cache,
+)
 from app.config import get_settings
 from app.db import Conversation, Message, get_db
-from app.llm import check_llm_health, get_llm
+from app.fetch_scheduler import get_fetch_scheduler
+from app.jobs import QueueFullError, get_job_queue
+from app.llm import check_llm_health
+from app.llm_scheduler import get_llm_scheduler
+from app.metrics import ERRORS, REGISTRY
 from app.models import (
+    BriefingDelta,
     ConversationCreate,
     ConversationListItem,
     ConversationResponse,
     ConversationUpdate,
+    CredibilityScoreRequest,
+    CredibilityScoreResponse,
     PDFExportRequest,
+    ResearchJobResponse,
     ResearchProgress,
     ResearchRequest,
     ResearchResult,
+    ResearchStatus,
 )
+from app.tools.credibility_model import get_credibility_model_store
 
 router = APIRouter()
 
@@ -45,9 +61,9 @@ async def stream_research(
     topic: str,
     depth: str,
     include_academic: bool = False,
+    time_budget: Optional[float] = None,
 ) -> AsyncGenerator[dict, None]:
     """Stream research progress as SSE events."""
-    settings = get_settings()
     cache = get_cache()
     
     # Check cache first
@@ -73,42 +89,77 @@ async def stream_research(
         }
         return
     
-    llm = get_llm()
-
-    agent = ResearchAgent(
-        llm=llm,
-        max_sources=settings.max_sources_to_process,
-        min_credibility=0.4,
+    # Attach to an identical run already in flight, or start a new one
+    single_flight = get_single_flight()
+    run = single_flight.join_or_start(
+        single_flight.make_key(topic, depth, include_academic, time_budget),
+        lambda: run_research(topic, depth, include_academic, time_budget),
     )
+    async for event in run.subscribe():
+        yield event
+
+
+async def run_research(
+    topic: str,
+    depth: str,
+    include_academic: bool = False,
+    time_budget: Optional[float] = None,
+) -> AsyncGenerator[dict, None]:
+    """Run the research pipeline, yielding SSE events and caching the result."""
+    settings = get_settings()
+    cache = get_cache()
+    agent = get_research_agent()
+    job_queue = get_job_queue()
 
     final_result = None
 
-    try:
-        async for event in agent.research(
-            topic=topic, 
-            depth=depth,
-            include_academic=include_academic,
-        ):
-            if isinstance(event, ResearchProgress):
-                yield {
-                    "event": "progress",
-                    "data": json.dumps(event.model_dump()),
-                }
-            elif isinstance(event, ResearchResult):
-                final_result = event.model_dump()
-                yield {
-                    "event": "result",
-                    "data": json.dumps(final_result),
-                }
-    except Exception as e:
+    if job_queue.pipelines_full():
+        waiting = ResearchProgress(
+            status=ResearchStatus.PENDING,
+            message="Waiting for a free research worker",
+            progress=0.0,
+        )
         yield {
-            "event": "error",
-            "data": json.dumps({"message": str(e)}),
+            "event": "progress",
+            "data": json.dumps(waiting.model_dump()),
         }
-        return
+
+    # Streamed and background research share the RESEARCH_WORKERS pipeline slots
+    async with job_queue.pipeline_slot():
+        try:
+            async for event in agent.research(
+                topic=topic, 
+                depth=depth,
+                include_academic=include_academic,
+                stream_briefing=True,
+                time_budget=time_budget or settings.research_time_budget_seconds,
+            ):
+                if isinstance(event, ResearchProgress):
+                    yield {
+                        "event": "progress",
+                        "data": json.dumps(event.model_dump()),
+                    }
+                elif isinstance(event, BriefingDelta):
+                    yield {
+                        "event": "briefing_delta",
+                        "data": json.dumps(event.model_dump()),
+                    }
+                elif isinstance(event, ResearchResult):
+                    final_result = event.model_dump()
+                    yield {
+                        "event": "result",
+                        "data": json.dumps(final_result),
+                    }
+        except Exception as e:
+            ERRORS.inc(stage="research")
+            yield {
+                "event": "error",
+                "data": json.dumps({"message": str(e)}),
+            }
+            return
     
-    # Cache the successful result
-    if final_result:
+    # Cache the successful result (degraded results are not worth reusing)
+    if final_result and not final_result.get("degraded"):
         cache.set(topic, depth, final_result, include_academic)
 
 
@@ -129,6 +180,7 @@ async def start_research(
     
     Returns Server-Sent Events (SSE) with:
     - progress: Status updates during research
+    - briefing_delta: Briefing text as it is generated
     - result: Final research briefing
     - error: Any errors that occurred
     """
@@ -137,10 +189,76 @@ async def start_research(
             topic=research_request.topic, 
             depth=research_request.depth,
             include_academic=research_request.include_academic,
+            time_budget=research_request.time_budget_seconds,
         )
     )
 
 
+@router.post("/research/jobs", response_model=ResearchJobResponse, status_code=202)
+@limiter.limit("10/minute")
+@limiter.limit("100/hour")
+async def submit_research_job(
+    request: Request,
+    research_request: ResearchRequest,
+    user_id: Optional[str] = Depends(get_optional_user_id),
+):
+    """
+    Queue a research task for background execution.
+
+    Returns the job immediately; stream its events from
+    `/research/jobs/{job_id}/events`. Responds 503 when the queue is full.
+    """
+    try:
+        job = get_job_queue().submit(research_request)
+    except QueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return job.to_dict()
+
+
+@router.get("/research/jobs/{job_id}", response_model=ResearchJobResponse)
+async def get_research_job(job_id: str):
+    """Get the status of a background research job."""
+    job = get_job_queue().get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Research job not found")
+    return job.to_dict()
+
+
+@router.get("/research/jobs/{job_id}/events")
+async def stream_research_job(job_id: str, request: Request):
+    """
+    Stream the events of a background research job.
+
+    Events recorded so far are replayed first. Reconnecting clients can send
+    `Last-Event-ID` to resume after the last event they received.
+    """
+    job = get_job_queue().get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Research job not found")
+
+    last_event_id = request.headers.get("last-event-id", "")
+    start = int(last_event_id) + 1 if last_event_id.isdigit() else 0
+
+    async def replay() -> AsyncGenerator[dict, None]:
+        index = start
+        async for event in job.log.subscribe(start=start):
+            yield {**event, "id": str(index)}
+            index += 1
+
+    return EventSourceResponse(replay())
+
+
+@router.get("/research/jobs")
+async def research_job_stats():
+    """Get background job queue, outbound fetch and LLM scheduling statistics."""
+    return {
+        **get_job_queue().stats(),
+        "fetch_scheduler": get_fetch_scheduler().stats(),
+        "fetch_failures": get_failure_cache().stats(),
+        "llm_scheduler": get_llm_scheduler().stats(),
+    }
+
+
 # ============================================================================
 # Cache Endpoints
 # ============================================================================
@@ -149,7 +267,13 @@ async def start_research(
 async def cache_stats():
     """Get cache statistics."""
     cache = get_cache()
-    return cache.stats()
+    return {
+        **cache.stats(),
+        "single_flight": get_single_flight().stats(),
+        "content_store": await get_content_store().stats(),
+        "summaries": await get_summary_cache().stats(),
+        "credibility": get_credibility_model_store().stats(),
+    }
 
 
 @router.post("/cache/clear")
@@ -157,7 +281,14 @@ async def clear_cache():
     """Clear all cached research results."""
     cache = get_cache()
     count = cache.clear()
-    return {"status": "cleared", "entries_removed": count}
+    pages = await get_content_store().clear()
+    summaries = await get_summary_cache().clear()
+    return {
+        "status": "cleared",
+        "entries_removed": count,
+        "pages_removed": pages,
+        "summaries_removed": summaries,
+    }
 
 
 @router.delete("/cache/{topic}")
@@ -168,6 +299,25 @@ async def invalidate_cache(topic: str, depth: str = "standard", include_academic
     return {"status": "invalidated" if invalidated else "not_found", "topic": topic}
 
 
+# ============================================================================
+# Credibility Endpoints
+# ============================================================================
+
+@router.post("/credibility/score", response_model=CredibilityScoreResponse)
+@limiter.limit("60/minute")
+async def score_credibility(request: Request, score_request: CredibilityScoreRequest):
+    """Score a batch of URLs with the research pipeline's credibility filter."""
+    tool = get_research_agent().credibility_tool
+    scores = tool.score_many(score_request.urls)
+    return {
+        "version": get_credibility_model_store().current().version,
+        "scores": [
+            {"url": url, "score": score, "credible": score >= tool.min_credibility}
+            for url, score in scores.items()
+        ]
+    }
+
+
 # ============================================================================
 # Conversation Endpoints (Authenticated)
 # ============================================================================
@@ -561,6 +711,15 @@ async def llm_health_check():
     return check_llm_health()
 
 
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Expose pipeline metrics in Prometheus text format."""
+    return PlainTextResponse(
+        REGISTRY.render(),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
 @router.get("/config")
 async def get_config():
     """Get current configuration (non-sensitive)."""
@@ -1,9 +1,21 @@
 """Caching package."""
 
+from .content_store import ContentStore, get_content_store
+from .failure_cache import FailureCache, get_failure_cache
 from .research_cache import ResearchCache, get_cache
+from .single_flight import SingleFlight, get_single_flight
+from .summary_cache import SummaryCache, get_summary_cache
 
 __all__ = [
+    "ContentStore",
+    "FailureCache",
     "ResearchCache",
+    "SingleFlight",
+    "SummaryCache",
     "get_cache",
+    "get_content_store",
+    "get_failure_cache",
+    "get_single_flight",
+    "get_summary_cache",
 ]
 
@@ -0,0 +1,204 @@
+"""Persistent, URL-keyed store of extracted page content."""
+
+import hashlib
+import re
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+import httpx
+from sqlalchemy import delete, func, select
+
+from app.config import get_settings
+from app.db.database import async_session_maker
+from app.db.models import PageContent
+from app.metrics import CONTENT_STORE_REQUESTS
+
+_MAX_AGE = re.compile(r"(?:^|,)\s*(?:s-maxage|max-age)\s*=\s*\"?(\d+)", re.I)
+
+
+class ContentStore:
+    """
+    SQLite-backed store of extracted page text, shared across research runs.
+
+    Features:
+    - Popular pages are fetched and parsed once, not once per topic
+    - Freshness from Cache-Control max-age (default TTL otherwise)
+    - Stale entries are revalidated with If-None-Match / If-Modified-Since
+    - `no-store` responses are never kept
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        default_ttl_hours: float = 24,
+        max_ttl_hours: float = 24 * 7,
+        retention_days: int = 30,
+    ):
+        self.enabled = enabled
+        self.default_ttl = timedelta(hours=default_ttl_hours)
+        self.max_ttl = timedelta(hours=max_ttl_hours)
+        self.retention = timedelta(days=retention_days)
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    @staticmethod
+    def _make_key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def ttl_for(self, headers: httpx.Headers) -> Optional[timedelta]:
+        """
+        How long a response may be served without revalidation.
+
+        Returns None when the response must not be stored at all.
+        """
+        cache_control = headers.get("cache-control", "").lower()
+        if "no-store" in cache_control:
+            return None
+        if "no-cache" in cache_control:
+            return timedelta(0)
+        match = _MAX_AGE.search(cache_control)
+        if match:
+            return min(timedelta(seconds=int(match.group(1))), self.max_ttl)
+        return self.default_ttl
+
+    async def get(self, url: str, engine: str) -> Optional[PageContent]:
+        """Look up the stored page for `url` extracted with `engine` (fresh or stale)."""
+        if not self.enabled:
+            return None
+        try:
+            async with async_session_maker() as session:
+                page = await session.get(PageContent, self._make_key(url))
+        except Exception as e:
+            print(f"⚠️ Content store lookup failed: {type(e).__name__}: {str(e)}")
+            return None
+        return page if page is not None and page.engine == engine else None
+
+    async def get_many(self, urls: list[str], engine: str) -> dict[str, PageContent]:
+        """Look up several URLs in one query."""
+        if not self.enabled or not urls:
+            return {}
+        keys = [self._make_key(url) for url in urls]
+        try:
+            async with async_session_maker() as session:
+                rows = await session.scalars(
+                    select(PageContent).where(
+                        PageContent.url_hash.in_(keys), PageContent.engine == engine
+                    )
+                )
+                return {page.url: page for page in rows}
+        except Exception as e:
+            print(f"⚠️ Content store lookup failed: {type(e).__name__}: {str(e)}")
+            return {}
+
+    def record(self, result: str) -> None:
+        """Count a lookup outcome: hit, revalidated or miss."""
+        if result == "hit":
+            self.hits += 1
+        elif result == "revalidated":
+            self.revalidated += 1
+        else:
+            self.misses += 1
+        CONTENT_STORE_REQUESTS.inc(result=result)
+
+    async def put(self, url: str, engine: str, content: str, headers: httpx.Headers) -> None:
+        """Store freshly extracted content with the response's validators."""
+        ttl = self.ttl_for(headers)
+        if not self.enabled or ttl is None:
+            return
+        now = datetime.utcnow()
+        page = PageContent(
+            url_hash=self._make_key(url),
+            url=url,
+            engine=engine,
+            content=content,
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+            fetched_at=now,
+            expires_at=now + ttl,
+        )
+        try:
+            async with async_session_maker() as session:
+                await session.merge(page)
+                await session.commit()
+        except Exception as e:
+            print(f"⚠️ Content store write failed: {type(e).__name__}: {str(e)}")
+
+    async def refresh(self, page: PageContent, headers: httpx.Headers) -> None:
+        """Extend a stored page after a 304 Not Modified revalidation."""
+        ttl = self.ttl_for(headers)
+        if not self.enabled:
+            return
+        try:
+            async with async_session_maker() as session:
+                if ttl is None:
+                    await session.execute(
+                        delete(PageContent).where(PageContent.url_hash == page.url_hash)
+                    )
+                else:
+                    stored = await session.get(PageContent, page.url_hash)
+                    if stored is not None:
+                        now = datetime.utcnow()
+                        stored.fetched_at = now
+                        stored.expires_at = now + ttl
+                        stored.etag = headers.get("etag") or stored.etag
+                        stored.last_modified = (
+                            headers.get("last-modified") or stored.last_modified
+                        )
+                await session.commit()
+        except Exception as e:
+            print(f"⚠️ Content store write failed: {type(e).__name__}: {str(e)}")
+
+    async def purge(self) -> int:
+        """Delete entries not refreshed within the retention period."""
+        async with async_session_maker() as session:
+            result = await session.execute(
+                delete(PageContent).where(
+                    PageContent.fetched_at < datetime.utcnow() - self.retention
+                )
+            )
+            await session.commit()
+        return result.rowcount
+
+    async def clear(self) -> int:
+        """Delete all stored pages. Returns count of removed entries."""
+        async with async_session_maker() as session:
+            result = await session.execute(delete(PageContent))
+            await session.commit()
+        return result.rowcount
+
+    async def stats(self) -> dict[str, Any]:
+        """Get store statistics."""
+        async with async_session_maker() as session:
+            size = await session.scalar(select(func.count()).select_from(PageContent))
+        total_requests = self.hits + self.revalidated + self.misses
+        hit_rate = (
+            (self.hits + self.revalidated) / total_requests * 100 if total_requests > 0 else 0
+        )
+        return {
+            "enabled": self.enabled,
+            "size": size,
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "total_requests": total_requests,
+            "hit_rate_percent": round(hit_rate, 2),
+        }
+
+
+# Singleton store instance
+_content_store_instance: Optional[ContentStore] = None
+
+
+def get_content_store() -> ContentStore:
+    """Get the singleton content store."""
+    global _content_store_instance
+    if _content_store_instance is None:
+        settings = get_settings()
+        _content_store_instance = ContentStore(
+            enabled=settings.content_store_enabled,
+            default_ttl_hours=settings.content_store_ttl_hours,
+            max_ttl_hours=settings.content_store_max_ttl_hours,
+            retention_days=settings.content_store_retention_days,
+        )
+    return _content_store_instance
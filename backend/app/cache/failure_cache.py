@@ -0,0 +1,159 @@
+"""Negative cache of failing URLs and per-domain circuit breakers."""
+
+import time
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+from cachetools import LRUCache
+
+from app.config import get_settings
+from app.metrics import CIRCUITS_OPEN, FETCH_SHORT_CIRCUITED
+
+
+class FailureCache:
+    """
+    Remembers recent fetch failures so they are not paid for twice.
+
+    Features:
+    - URL negative cache: a failed URL is skipped for an exponentially
+      growing backoff (base, 2x base, 4x base, ... up to a maximum)
+    - Domain circuit breaker: after `failure_threshold` consecutive
+      domain-level failures (timeouts, connection errors, 403/429/5xx) the
+      domain is opened and every fetch to it fails fast. After the cooldown a
+      single probe is let through (half-open): success closes the circuit,
+      failure re-opens it with a doubled cooldown.
+    """
+
+    def __init__(
+        self,
+        backoff_base_seconds: float = 60.0,
+        backoff_max_seconds: float = 3600.0,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 60.0,
+        maxsize: int = 10000,
+    ):
+        self.backoff_base = backoff_base_seconds
+        self.backoff_max = backoff_max_seconds
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown_seconds
+        # url -> {"failures", "retry_at", "reason"}
+        self._urls: LRUCache = LRUCache(maxsize=maxsize)
+        # domain -> {"failures", "trips", "open_until", "probe_started"}
+        self._domains: LRUCache = LRUCache(maxsize=maxsize)
+
+    @staticmethod
+    def _domain(url: str) -> str:
+        domain = urlparse(url).netloc.lower()
+        return domain[4:] if domain.startswith("www.") else domain
+
+    def _backoff(self, base: float, attempts: int) -> float:
+        return min(base * 2 ** (attempts - 1), self.backoff_max)
+
+    def _update_gauge(self) -> None:
+        CIRCUITS_OPEN.set(sum(1 for state in self._domains.values() if state["open_until"]))
+
+    def is_open(self, url: str) -> bool:
+        """Whether the circuit for the domain of `url` is open (cooldown not over)."""
+        state = self._domains.get(self._domain(url))
+        return bool(state and state["open_until"] and time.monotonic() < state["open_until"])
+
+    def check(self, url: str) -> Optional[str]:
+        """
+        Decide whether `url` may be fetched now.
+
+        Returns None to go ahead, or the reason the fetch should fail fast.
+        A domain whose cooldown has passed admits one probe at a time.
+        """
+        now = time.monotonic()
+
+        entry = self._urls.get(url)
+        if entry and now < entry["retry_at"]:
+            FETCH_SHORT_CIRCUITED.inc(scope="url")
+            return f"Recently failed ({entry['reason']}), retrying in {entry['retry_at'] - now:.0f}s"
+
+        state = self._domains.get(self._domain(url))
+        if state and state["open_until"]:
+            # A probe that never reported back (e.g. cancelled) expires after a cooldown
+            probing = state["probe_started"] and now - state["probe_started"] < self.cooldown
+            if now < state["open_until"] or probing:
+                FETCH_SHORT_CIRCUITED.inc(scope="domain")
+                return f"Circuit open for {self._domain(url)}"
+            state["probe_started"] = now  # Half-open: this fetch is the probe
+        return None
+
+    def _close(self, domain: str) -> None:
+        state = self._domains.pop(domain, None)
+        if state and state["open_until"]:
+            print(f"✓ Circuit closed for {domain}")
+            self._update_gauge()
+
+    def record_success(self, url: str) -> None:
+        """Clear failure state for `url` and close its domain's circuit."""
+        self._urls.pop(url, None)
+        self._close(self._domain(url))
+
+    def record_failure(self, url: str, reason: str, domain_failure: bool = False) -> None:
+        """
+        Record a failed fetch of `url`.
+
+        `domain_failure` marks failures that say something about the whole
+        host (timeouts, blocks, server errors) and count towards its circuit.
+        """
+        now = time.monotonic()
+
+        entry = self._urls.get(url) or {"failures": 0}
+        entry["failures"] += 1
+        entry["reason"] = reason
+        entry["retry_at"] = now + self._backoff(self.backoff_base, entry["failures"])
+        self._urls[url] = entry
+
+        domain = self._domain(url)
+        if not domain_failure:
+            self._close(domain)  # The host answered, so it is up
+            return
+
+        state = self._domains.get(domain) or {
+            "failures": 0, "trips": 0, "open_until": 0.0, "probe_started": 0.0,
+        }
+        if not state["probe_started"] and now < state["open_until"]:
+            return  # Already open: a fetch that was in flight when it tripped
+
+        state["failures"] += 1
+        # Only a closed circuit crossing the threshold or a failed probe (re-)opens it
+        if state["probe_started"] or state["failures"] >= self.failure_threshold:
+            state["trips"] += 1
+            state["failures"] = 0
+            state["open_until"] = now + self._backoff(self.cooldown, state["trips"])
+            state["probe_started"] = 0.0
+            print(f"⚠️ Circuit open for {domain} ({reason}), cooling down {state['open_until'] - now:.0f}s")
+        self._domains[domain] = state
+        self._update_gauge()
+
+    def stats(self) -> dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "failing_urls": sum(1 for entry in self._urls.values() if now < entry["retry_at"]),
+            "open_circuits": sorted(
+                domain
+                for domain, state in self._domains.items()
+                if state["open_until"] and now < state["open_until"]
+            ),
+        }
+
+
+# Singleton failure cache
+_failure_cache_instance: Optional[FailureCache] = None
+
+
+def get_failure_cache() -> FailureCache:
+    """Get the process-wide failure cache."""
+    global _failure_cache_instance
+    if _failure_cache_instance is None:
+        settings = get_settings()
+        _failure_cache_instance = FailureCache(
+            backoff_base_seconds=settings.fetch_failure_backoff_seconds,
+            backoff_max_seconds=settings.fetch_failure_backoff_max_seconds,
+            failure_threshold=settings.circuit_failure_threshold,
+            cooldown_seconds=settings.circuit_cooldown_seconds,
+        )
+    return _failure_cache_instance
@@ -8,6 +8,8 @@ from typing import Any, Optional
 
 from cachetools import TTLCache
 
+from app.metrics import CACHE_REQUESTS
+
 
 class ResearchCache:
     """
@@ -45,9 +47,11 @@ class ResearchCache:
         
         if result is not None:
             self.hits += 1
+            CACHE_REQUESTS.inc(result="hit")
             return result
         
         self.misses += 1
+        CACHE_REQUESTS.inc(result="miss")
         return None
 
     def set(
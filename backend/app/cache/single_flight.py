@@ -0,0 +1,133 @@
+"""Single-flight coalescing of identical in-flight research runs."""
+
+import asyncio
+import json
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Optional
+
+
+class InFlightRun:
+    """
+    A research run shared by every request with the same parameters.
+
+    Events are recorded in order, so subscribers that attach late still
+    receive the full progress history before the live events.
+    """
+
+    def __init__(self, key: tuple):
+        self.key = key
+        self.events: list[dict] = []
+        self.done = False
+        self.subscribers = 0
+        self.task: Optional[asyncio.Task] = None
+        self._changed = asyncio.Condition()
+
+    async def publish(self, event: dict) -> None:
+        """Record an event and wake up subscribers."""
+        async with self._changed:
+            self.events.append(event)
+            self._changed.notify_all()
+
+    async def close(self) -> None:
+        """Mark the run as finished."""
+        async with self._changed:
+            self.done = True
+            self._changed.notify_all()
+
+    async def subscribe(self, start: int = 0) -> AsyncGenerator[dict, None]:
+        """Replay recorded events from `start`, then follow the run until it finishes."""
+        self.subscribers += 1
+        index = start
+        try:
+            while True:
+                async with self._changed:
+                    await self._changed.wait_for(
+                        lambda: index < len(self.events) or self.done
+                    )
+                    batch = self.events[index:]
+                    done = self.done
+
+                index += len(batch)
+                for event in batch:
+                    yield event
+
+                if done and index >= len(self.events):
+                    return
+        finally:
+            self.subscribers -= 1
+
+
+class SingleFlight:
+    """
+    Registry of in-flight research runs keyed by request parameters.
+
+    The first request for a key starts the run as a background task; identical
+    requests arriving while it is running attach to it instead of starting
+    their own pipeline. The run keeps going if its original client disconnects.
+    """
+
+    def __init__(self):
+        self._runs: dict[tuple, InFlightRun] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def make_key(
+        topic: str,
+        depth: str,
+        include_academic: bool = False,
+        time_budget: Optional[float] = None,
+    ) -> tuple:
+        """Build the coalescing key (normalized like the result cache)."""
+        return (topic.lower().strip(), depth, include_academic, time_budget)
+
+    def join_or_start(
+        self,
+        key: tuple,
+        producer_factory: Callable[[], AsyncIterator[dict]],
+    ) -> InFlightRun:
+        """Attach to the run for `key`, starting it if none is in flight."""
+        run = self._runs.get(key)
+        if run is not None:
+            self.coalesced += 1
+            return run
+
+        run = InFlightRun(key)
+        self._runs[key] = run
+        self.started += 1
+        run.task = asyncio.create_task(self._drive(run, producer_factory()))
+        return run
+
+    async def _drive(self, run: InFlightRun, producer: AsyncIterator[dict]) -> None:
+        """Pump producer events into the run until it is exhausted."""
+        try:
+            async for event in producer:
+                await run.publish(event)
+        except Exception as e:
+            await run.publish({
+                "event": "error",
+                "data": json.dumps({"message": str(e)}),
+            })
+        finally:
+            self._runs.pop(run.key, None)
+            await run.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Get single-flight statistics."""
+        return {
+            "in_flight": len(self._runs),
+            "subscribers": sum(run.subscribers for run in self._runs.values()),
+            "runs_started": self.started,
+            "requests_coalesced": self.coalesced,
+        }
+
+
+# Singleton registry instance
+_single_flight_instance: Optional[SingleFlight] = None
+
+
+def get_single_flight() -> SingleFlight:
+    """Get the singleton single-flight registry."""
+    global _single_flight_instance
+    if _single_flight_instance is None:
+        _single_flight_instance = SingleFlight()
+    return _single_flight_instance
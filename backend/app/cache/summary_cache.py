@@ -0,0 +1,171 @@
+"""Persistent cache of per-source LLM summaries."""
+
+import hashlib
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from sqlalchemy import delete, func, select
+
+from app.config import get_settings
+from app.db.database import async_session_maker
+from app.db.models import SourceSummary
+from app.metrics import SUMMARY_CACHE_REQUESTS
+
+# Writes between two size-limit evictions
+_EVICT_EVERY = 100
+
+
+def normalize_topic(topic: str) -> str:
+    """
+    Canonical form of a topic for cache keys.
+
+    Only case and whitespace are ignored. Word order is kept, since
+    "python vs rust" and "rust vs python" can call for different summaries.
+    """
+    return " ".join(topic.lower().split())[:500]
+
+
+class SummaryCache:
+    """
+    SQLite-backed cache of source summaries, shared across research runs.
+
+    Features:
+    - Keyed by (content hash, normalized topic, model, prompt version), so a
+      changed page, model or prompt never serves a stale summary
+    - TTL expiration (summaries older than the TTL are recomputed)
+    - Size limit with least-recently-used eviction
+    """
+
+    def __init__(self, enabled: bool = True, ttl_hours: float = 168, max_entries: int = 20000):
+        self.enabled = enabled
+        self.ttl = timedelta(hours=ttl_hours)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+
+    @staticmethod
+    def content_hash(content: str) -> str:
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    @staticmethod
+    def _make_key(content_hash: str, topic: str, model: str, prompt_version: str) -> str:
+        key_data = f"{content_hash}:{topic}:{model}:{prompt_version}"
+        return hashlib.sha256(key_data.encode()).hexdigest()
+
+    async def get(
+        self, content: str, topic: str, model: str, prompt_version: str
+    ) -> Optional[str]:
+        """Cached summary of `content` for `topic`, or None."""
+        if not self.enabled:
+            return None
+        key = self._make_key(
+            self.content_hash(content), normalize_topic(topic), model, prompt_version
+        )
+        summary = None
+        try:
+            async with async_session_maker() as session:
+                entry = await session.get(SourceSummary, key)
+                if entry is not None and entry.created_at > datetime.utcnow() - self.ttl:
+                    summary = entry.summary
+                    entry.last_used_at = datetime.utcnow()
+                    await session.commit()
+        except Exception as e:
+            print(f"⚠️ Summary cache lookup failed: {type(e).__name__}: {str(e)}")
+
+        if summary is not None:
+            self.hits += 1
+            SUMMARY_CACHE_REQUESTS.inc(result="hit")
+        else:
+            self.misses += 1
+            SUMMARY_CACHE_REQUESTS.inc(result="miss")
+        return summary
+
+    async def put(
+        self, content: str, topic: str, model: str, prompt_version: str, summary: str
+    ) -> None:
+        """Cache the summary of `content` for `topic`."""
+        if not self.enabled:
+            return
+        content_hash = self.content_hash(content)
+        topic = normalize_topic(topic)
+        now = datetime.utcnow()
+        entry = SourceSummary(
+            key=self._make_key(content_hash, topic, model, prompt_version),
+            content_hash=content_hash,
+            topic=topic,
+            model=model,
+            prompt_version=prompt_version,
+            summary=summary,
+            created_at=now,
+            last_used_at=now,
+        )
+        try:
+            async with async_session_maker() as session:
+                await session.merge(entry)
+                await session.commit()
+            self._writes += 1
+            if self._writes % _EVICT_EVERY == 0:
+                await self.evict()
+        except Exception as e:
+            print(f"⚠️ Summary cache write failed: {type(e).__name__}: {str(e)}")
+
+    async def evict(self) -> int:
+        """Delete expired summaries and the least recently used ones beyond the size limit."""
+        async with async_session_maker() as session:
+            expired = await session.execute(
+                delete(SourceSummary).where(
+                    SourceSummary.created_at < datetime.utcnow() - self.ttl
+                )
+            )
+            keep = (
+                select(SourceSummary.key)
+                .order_by(SourceSummary.last_used_at.desc())
+                .limit(self.max_entries)
+            )
+            surplus = await session.execute(
+                delete(SourceSummary).where(SourceSummary.key.not_in(keep))
+            )
+            await session.commit()
+        return expired.rowcount + surplus.rowcount
+
+    async def clear(self) -> int:
+        """Delete all cached summaries. Returns count of removed entries."""
+        async with async_session_maker() as session:
+            result = await session.execute(delete(SourceSummary))
+            await session.commit()
+        return result.rowcount
+
+    async def stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        async with async_session_maker() as session:
+            size = await session.scalar(select(func.count()).select_from(SourceSummary))
+        total_requests = self.hits + self.misses
+        hit_rate = self.hits / total_requests * 100 if total_requests > 0 else 0
+        return {
+            "enabled": self.enabled,
+            "size": size,
+            "max_entries": self.max_entries,
+            "ttl_hours": self.ttl.total_seconds() / 3600,
+            "hits": self.hits,
+            "misses": self.misses,
+            "total_requests": total_requests,
+            "hit_rate_percent": round(hit_rate, 2),
+        }
+
+
+# Singleton cache instance
+_summary_cache_instance: Optional[SummaryCache] = None
+
+
+def get_summary_cache() -> SummaryCache:
+    """Get the singleton summary cache."""
+    global _summary_cache_instance
+    if _summary_cache_instance is None:
+        settings = get_settings()
+        _summary_cache_instance = SummaryCache(
+            enabled=settings.summary_cache_enabled,
+            ttl_hours=settings.summary_cache_ttl_hours,
+            max_entries=settings.summary_cache_max_entries,
+        )
+    return _summary_cache_instance
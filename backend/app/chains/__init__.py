@@ -1,9 +1,11 @@
 """Chains package for research agent."""
 
+from .query_expander import QueryExpanderChain
 from .summarizer import SummarizerChain
 from .synthesizer import SynthesizerChain
 
 __all__ = [
+    "QueryExpanderChain",
     "SummarizerChain",
     "SynthesizerChain",
 ]
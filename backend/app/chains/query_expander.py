@@ -0,0 +1,57 @@
+"""Query expansion chain for deep research."""
+
+import re
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+
+EXPAND_PROMPT = ChatPromptTemplate.from_messages([
+    (
+        "system",
+        """You are a research assistant that plans web searches.
+
+Given a research topic, write distinct search engine queries that together cover
+its most important aspects (for example background, recent developments, data
+and statistics, expert analysis, criticism).
+
+Rules:
+- Output exactly one query per line
+- No numbering, bullets, quotes or explanations
+- Keep each query under 12 words""",
+    ),
+    (
+        "human",
+        """Topic: {topic}
+
+Write {count} search queries.""",
+    ),
+])
+
+# Leading list markers the model sometimes adds despite the instructions
+_LIST_MARKER = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s*")
+
+
+class QueryExpanderChain:
+    """Chain for expanding a research topic into sub-queries."""
+
+    def __init__(self, llm: BaseChatModel):
+        self.llm = llm
+        self.chain = EXPAND_PROMPT | llm | StrOutputParser()
+
+    async def expand(self, topic: str, count: int = 3) -> list[str]:
+        """Generate up to `count` sub-queries distinct from the topic itself."""
+        if count <= 0:
+            return []
+
+        result = await self.chain.ainvoke({"topic": topic, "count": count})
+
+        queries = []
+        seen = {topic.lower().strip()}
+        for line in result.splitlines():
+            query = _LIST_MARKER.sub("", line).strip().strip('"\'')
+            if query and query.lower() not in seen:
+                seen.add(query.lower())
+                queries.append(query)
+
+        return queries[:count]
@@ -1,9 +1,22 @@
 """Summarization chain for individual sources."""
 
+import asyncio
+from typing import Optional
+
 from langchain_core.language_models import BaseChatModel
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 
+from app.cache import SummaryCache
+from app.chains.tokens import count_tokens, split_tokens, truncate_tokens
+from app.llm import limit_output
+
+# Bump when a prompt changes, so cached summaries from the old prompts are not served
+PROMPT_VERSION = "1"
+
+# Tokens shared by consecutive chunks, so a sentence cut at a boundary is whole in one
+CHUNK_OVERLAP_TOKENS = 100
+
 SUMMARIZE_PROMPT = ChatPromptTemplate.from_messages([
     (
         "system",
@@ -33,12 +46,96 @@ Provide a focused summary of this source as it relates to the research topic."""
 ])
 
 
+# Map step: one section of a long source
+CHUNK_PROMPT = ChatPromptTemplate.from_messages([
+    (
+        "system",
+        """You are a research assistant that extracts the essential content of one
+section of a longer document.
+
+Summarize only what this section says that is relevant to the research topic:
+key facts, findings, data, arguments and expert opinions. Keep it factual and
+objective. If the section contains nothing relevant, reply with "No relevant content."
+Use at most {max_words} words.""",
+    ),
+    (
+        "human",
+        """Topic: {topic}
+
+Source: {title}
+URL: {url}
+
+Section {index} of {total}:
+{content}
+
+Summarize this section as it relates to the research topic.""",
+    ),
+])
+
+# Reduce step: section summaries combined into one source summary
+REDUCE_PROMPT = ChatPromptTemplate.from_messages([
+    (
+        "system",
+        """You are a research assistant that creates concise, accurate summaries.
+
+You are given summaries of consecutive sections of one document. Combine them
+into a single summary of the whole document. Focus on:
+- Key facts and findings
+- Main arguments or conclusions
+- Relevant data or statistics
+- Notable quotes or expert opinions
+
+Merge repeated points, keep the summary factual and objective, and do not add
+interpretation or speculation. Aim for 3-5 paragraphs maximum.""",
+    ),
+    (
+        "human",
+        """Topic: {topic}
+
+Source: {title}
+URL: {url}
+
+Section summaries, in document order:
+{content}
+
+Provide a focused summary of this source as it relates to the research topic.""",
+    ),
+])
+
+
 class SummarizerChain:
     """Chain for summarizing individual source content."""
 
-    def __init__(self, llm: BaseChatModel):
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        mode: str = "map_reduce",
+        chunk_tokens: int = 3000,
+        max_content_tokens: int = 24000,
+        chunk_summary_tokens: int = 400,
+        reduce_input_tokens: int = 4000,
+        reduce_output_tokens: int = 1000,
+        max_concurrency: int = 4,
+        cache: Optional[SummaryCache] = None,
+    ):
         self.llm = llm
         self.chain = SUMMARIZE_PROMPT | llm | StrOutputParser()
+        self.chunk_chain = CHUNK_PROMPT | limit_output(llm, chunk_summary_tokens) | StrOutputParser()
+        self.reduce_chain = REDUCE_PROMPT | limit_output(llm, reduce_output_tokens) | StrOutputParser()
+        self.mode = mode  # "map_reduce", or "truncate" to the first chunk
+        self.chunk_tokens = chunk_tokens  # Content tokens per LLM call
+        self.max_content_tokens = max_content_tokens  # Content beyond this is dropped
+        self.chunk_summary_tokens = chunk_summary_tokens  # Output budget per section summary
+        self.reduce_input_tokens = reduce_input_tokens  # Section summaries are clipped to fit
+        self.reduce_output_tokens = reduce_output_tokens  # Output budget for the combined summary
+        self.max_concurrency = max_concurrency  # Section summaries in flight per source
+        self.cache = cache
+        self.model = getattr(llm, "model_name", None) or getattr(llm, "model", None) or type(llm).__name__
+        # Budgets change what a summary covers, so they are part of the cache key
+        self.prompt_version = (
+            f"{PROMPT_VERSION}:{mode}:{chunk_tokens}:{max_content_tokens}:{chunk_summary_tokens}"
+            f":{reduce_input_tokens}:{reduce_output_tokens}"
+        )
 
     async def summarize(
         self,
@@ -47,22 +144,82 @@ class SummarizerChain:
         url: str,
         content: str,
     ) -> str:
-        """Summarize a single source."""
+        """
+        Summarize a single source.
+
+        Content that fits in one chunk is summarized in a single call. Longer
+        content is split on token boundaries, the chunks are summarized
+        concurrently (map) and the chunk summaries are combined (reduce).
+        Summaries are served from and written to the summary cache if one is set.
+        """
         if not content or content.startswith("[Error"):
             return "[Unable to summarize: content extraction failed]"
 
-        # Truncate content if too long for context window
-        max_content = 12000
-        if len(content) > max_content:
-            content = content[:max_content] + "\n\n[Content truncated for summarization]"
-
-        result = await self.chain.ainvoke({
+        if self.cache is not None:
+            cached = await self.cache.get(content, topic, self.model, self.prompt_version)
+            if cached is not None:
+                return cached
+
+        summary = await self._summarize(topic, title, url, content)
+        if self.cache is not None:
+            await self.cache.put(content, topic, self.model, self.prompt_version, summary)
+        return summary
+
+    async def _summarize(self, topic: str, title: str, url: str, content: str) -> str:
+        """Summarize with the LLM: one call, or map-reduce over chunks."""
+        if self.mode == "truncate" or count_tokens(content) <= self.chunk_tokens:
+            # Truncate content if too long for context window
+            content = truncate_tokens(
+                content, self.chunk_tokens, "\n\n[Content truncated for summarization]"
+            )
+            result = await self.chain.ainvoke({
+                "topic": topic,
+                "title": title,
+                "url": url,
+                "content": content,
+            })
+            return result.strip()
+
+        content = truncate_tokens(content, self.max_content_tokens)
+        chunks = split_tokens(content, self.chunk_tokens, overlap=CHUNK_OVERLAP_TOKENS)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def summarize_chunk(index: int, chunk: str) -> str:
+            async with semaphore:
+                result = await self.chunk_chain.ainvoke({
+                    "topic": topic,
+                    "title": title,
+                    "url": url,
+                    "index": index + 1,
+                    "total": len(chunks),
+                    "content": chunk,
+                    "max_words": self.chunk_summary_tokens * 3 // 4,
+                })
+            return result.strip()
+
+        tasks = [
+            asyncio.create_task(summarize_chunk(index, chunk))
+            for index, chunk in enumerate(chunks)
+        ]
+        try:
+            summaries = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        # Every section gets an equal share of the reduce prompt
+        share = min(self.chunk_summary_tokens, self.reduce_input_tokens // len(summaries))
+        sections = "\n\n".join(
+            f"[Section {index + 1}]\n{truncate_tokens(summary, share, ' ...')}"
+            for index, summary in enumerate(summaries)
+        )
+        result = await self.reduce_chain.ainvoke({
             "topic": topic,
             "title": title,
             "url": url,
-            "content": content,
+            "content": sections,
         })
-
         return result.strip()
 
     async def summarize_batch(
@@ -71,8 +228,6 @@ class SummarizerChain:
         sources: list[dict],
     ) -> list[dict]:
         """Summarize multiple sources."""
-        import asyncio
-
         async def summarize_one(source: dict) -> dict:
             summary = await self.summarize(
                 topic=topic,
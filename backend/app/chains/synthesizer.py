@@ -1,5 +1,7 @@
 """Synthesis chain for creating research briefings."""
 
+from typing import AsyncGenerator
+
 from langchain_core.language_models import BaseChatModel
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
@@ -73,7 +75,38 @@ class SynthesizerChain:
         if not sources:
             return "No sources available to synthesize."
 
-        # Format summaries for the prompt with clear citation numbers
+        result = await self.chain.ainvoke({
+            "topic": topic,
+            "summaries": self._format_summaries(sources),
+        })
+
+        return self.finalize(result, sources)
+
+    async def synthesize_stream(
+        self,
+        topic: str,
+        sources: list[dict],
+    ) -> AsyncGenerator[str, None]:
+        """
+        Stream the briefing as it is generated.
+
+        Yields raw text deltas from the LLM. Pass the concatenated deltas to
+        `finalize` to get the same briefing `synthesize` would return.
+        """
+        if not sources:
+            yield "No sources available to synthesize."
+            return
+
+        async for delta in self.chain.astream({
+            "topic": topic,
+            "summaries": self._format_summaries(sources),
+        }):
+            if delta:
+                yield delta
+
+    @staticmethod
+    def _format_summaries(sources: list[dict]) -> str:
+        """Format summaries for the prompt with clear citation numbers."""
         summaries_text = ""
         for i, source in enumerate(sources, 1):
             url = source.get('url', 'N/A')
@@ -89,17 +122,36 @@ Summary:
 
 ---
 """
+        return summaries_text.strip()
 
-        result = await self.chain.ainvoke({
-            "topic": topic,
-            "summaries": summaries_text.strip(),
-        })
+    @classmethod
+    def fallback_briefing(cls, topic: str, sources: list[dict]) -> str:
+        """Build a briefing straight from source summaries when synthesis ran out of time."""
+        if not sources:
+            return "No sources available to synthesize."
 
-        # Post-process to ensure references are properly formatted
+        findings = []
+        for i, source in enumerate(sources, 1):
+            summary = (source.get('summary') or source.get('content') or '').strip()
+            first_paragraph = summary.split("\n\n")[0].strip()
+            if first_paragraph:
+                findings.append(f"- {first_paragraph} [{i}]")
+
+        briefing = (
+            f"## Key Findings\n\n"
+            f"*Time budget exhausted before a full synthesis on \"{topic}\"; "
+            f"showing per-source findings.*\n\n"
+            + "\n".join(findings)
+        )
+        return cls.finalize(briefing, sources)
+
+    @staticmethod
+    def finalize(result: str, sources: list[dict]) -> str:
+        """Post-process raw LLM output to ensure references are properly formatted."""
         briefing = result.strip()
-        
+
         # If no References section exists, add one
-        if "## References" not in briefing and "## Sources" not in briefing:
+        if sources and "## References" not in briefing and "## Sources" not in briefing:
             references = "\n\n## References\n"
             for i, source in enumerate(sources, 1):
                 url = source.get('url', '#')
@@ -0,0 +1,66 @@
+"""Token counting and token-boundary splitting for LLM prompts.
+
+Uses tiktoken's `cl100k_base` encoding. Token counts are a budget estimate
+rather than the serving model's exact tokenizer, which is close enough for
+sizing prompts. When the encoding cannot be loaded (tiktoken downloads it
+on first use), a whitespace-preserving approximation of ~4 characters per
+token is used instead.
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, Optional
+
+ENCODING_NAME = "cl100k_base"
+CHARS_PER_TOKEN = 4
+
+# ~Token-sized pieces: runs of up to 4 non-space characters with their trailing space
+_PIECE = re.compile(r"\S{1,%d}\s*|\s+" % CHARS_PER_TOKEN)
+
+
+@lru_cache
+def _encoding():
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(ENCODING_NAME)
+    except Exception as e:
+        print(f"⚠️ tiktoken encoding {ENCODING_NAME} unavailable, approximating token counts: {e}")
+        return None
+
+
+def _tokenize(text: str) -> tuple[list, Callable[[list], str]]:
+    """Tokens of `text` and the function that turns a run of them back into text."""
+    encoding = _encoding()
+    if encoding is None:
+        return _PIECE.findall(text), "".join
+    return encoding.encode(text, disallowed_special=()), encoding.decode
+
+
+def count_tokens(text: str) -> int:
+    return len(_tokenize(text)[0])
+
+
+def split_tokens(text: str, chunk_tokens: int, overlap: int = 0) -> list[str]:
+    """
+    Split `text` into chunks of at most `chunk_tokens` tokens.
+
+    Consecutive chunks share `overlap` tokens so that sentences cut at a
+    boundary appear whole in one of them.
+    """
+    tokens, decode = _tokenize(text)
+    step = max(1, chunk_tokens - overlap)
+    chunks = []
+    for start in range(0, len(tokens), step):
+        chunks.append(decode(tokens[start:start + chunk_tokens]))
+        if start + chunk_tokens >= len(tokens):
+            break
+    return chunks
+
+
+def truncate_tokens(text: str, max_tokens: int, marker: Optional[str] = None) -> str:
+    """`text` cut to its first `max_tokens` tokens, followed by `marker` if cut."""
+    tokens, decode = _tokenize(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return decode(tokens[:max_tokens]) + (marker or "")
@@ -1,7 +1,7 @@
 """Application configuration using pydantic-settings."""
 import os
 from functools import lru_cache
-from typing import Literal
+from typing import Literal, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -25,6 +25,7 @@ class Settings(BaseSettings):
     llm_model: str = "llama3:8b"
     llm_temperature: float = 0.1
     llm_max_tokens: int = 4096
+    llm_max_concurrency: int = 8  # LLM calls in flight on the model server, across all requests
 
     # Google Custom Search API Configuration
     google_api_key: str = ""
@@ -37,6 +38,60 @@ class Settings(BaseSettings):
     # Search Configuration
     max_search_results: int = 10
     max_sources_to_process: int = 5
+    research_time_budget_seconds: Optional[float] = None  # Default per-request budget
+    extraction_hedge: int = 2  # Extra candidates to extract; first successes are kept
+    deep_research_subqueries: int = 3  # Extra LLM-generated queries in deep mode
+    search_max_concurrency: int = 4  # Searches in flight per request
+    duplicate_similarity_threshold: float = 0.8  # Estimated Jaccard; above 1 disables dedup
+    relevance_weight: float = 0.5  # Topic relevance vs credibility in ranking; 0 ranks by credibility
+
+    # Credibility Scoring
+    credibility_table_path: str = ""  # JSON credibility table; empty uses the bundled one
+    credibility_reload_seconds: float = 5.0  # How often the table file is checked for changes
+
+    # Source Summarization (token budgets; long sources are summarized map-reduce)
+    summarize_mode: Literal["map_reduce", "truncate"] = "map_reduce"
+    summarize_chunk_tokens: int = 3000  # Content tokens per LLM call
+    summarize_max_content_tokens: int = 24000  # Content beyond this is not summarized
+    summarize_chunk_summary_tokens: int = 400  # Output budget per chunk summary
+    summarize_reduce_input_tokens: int = 4000  # Chunk summaries are clipped to fit this
+    summarize_reduce_output_tokens: int = 1000  # Output budget for the combined summary
+    summarize_max_concurrency: int = 4  # Chunk summaries in flight per source
+
+    # Background Research Jobs
+    research_workers: int = 4  # Concurrent research pipelines
+    research_queue_size: int = 100  # Jobs waiting beyond this are rejected
+    research_job_ttl_minutes: int = 60  # How long finished jobs stay replayable
+
+    # Outbound HTTP (shared connection pool for all tools)
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry_seconds: float = 30.0
+    http_per_host_limit: int = 6  # Concurrent page downloads per host, across all research runs
+    fetch_max_concurrency: int = 50  # Concurrent page downloads, across all research runs
+    fetch_failure_backoff_seconds: float = 60.0  # Failed URL skipped for this, doubling per failure
+    fetch_failure_backoff_max_seconds: float = 3600.0
+    circuit_failure_threshold: int = 3  # Consecutive host failures before its circuit opens
+    circuit_cooldown_seconds: float = 60.0  # Open circuit waits this long before a probe
+    http2_enabled: bool = True  # Requires the h2 package (httpx[http2])
+
+    # Extracted Page Store (persistent, shared across research runs)
+    content_store_enabled: bool = True
+    content_store_ttl_hours: float = 24  # When the page sends no Cache-Control max-age
+    content_store_max_ttl_hours: float = 168  # Upper bound on max-age
+    content_store_retention_days: int = 30  # Stale entries kept for revalidation
+
+    # Source Summary Cache (persistent; keyed by content, topic, model and prompt version)
+    summary_cache_enabled: bool = True
+    summary_cache_ttl_hours: float = 168  # Summaries older than this are recomputed
+    summary_cache_max_entries: int = 20000  # Least recently used summaries are evicted beyond this
+
+    # HTML Parsing ("process" pool, "thread" pool, or "inline" on the event loop)
+    extraction_engine: Literal["readability", "html2text"] = "readability"
+    extraction_max_download_bytes: int = 2_000_000  # Page bodies are cut off here
+    extraction_max_content_chars: int = 100_000  # Extracted text is cut off here
+    html_parser_backend: Literal["process", "thread", "inline"] = "process"
+    html_parser_workers: int = 2
 
     # Server Configuration
     api_host: str = "0.0.0.0"
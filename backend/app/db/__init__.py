@@ -1,12 +1,14 @@
 """Database package."""
 
 from .database import get_db, init_db
-from .models import Base, Conversation, Message
+from .models import Base, Conversation, Message, PageContent, SourceSummary
 
 __all__ = [
     "Base",
     "Conversation",
     "Message",
+    "PageContent",
+    "SourceSummary",
     "get_db",
     "init_db",
 ]
@@ -68,3 +68,50 @@ class Message(Base):
 
     def __repr__(self) -> str:
         return f"<Message(id={self.id}, role='{self.role}')>"
+
+
+class PageContent(Base):
+    """Extracted text of a web page, shared across research runs."""
+
+    __tablename__ = "page_contents"
+
+    url_hash: Mapped[str] = mapped_column(String(64), primary_key=True)  # sha256 of url
+    url: Mapped[str] = mapped_column(Text, nullable=False)
+    engine: Mapped[str] = mapped_column(String(50), nullable=False)  # Extraction engine used
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    etag: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    last_modified: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    fetched_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires_at > datetime.utcnow()
+
+    def __repr__(self) -> str:
+        return f"<PageContent(url='{self.url[:50]}', expires_at={self.expires_at})>"
+
+
+class SourceSummary(Base):
+    """LLM summary of a page's content for a topic, shared across research runs."""
+
+    __tablename__ = "source_summaries"
+
+    # sha256 of (content hash, normalized topic, model, prompt version)
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    topic: Mapped[str] = mapped_column(String(500), nullable=False)  # Normalized
+    model: Mapped[str] = mapped_column(String(100), nullable=False)
+    prompt_version: Mapped[str] = mapped_column(String(100), nullable=False)
+    summary: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False, index=True
+    )
+    last_used_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False, index=True
+    )
+
+    def __repr__(self) -> str:
+        return f"<SourceSummary(topic='{self.topic[:30]}', model='{self.model}')>"
@@ -0,0 +1,154 @@
+"""Process-wide scheduling of outbound fetches.
+
+Every page download takes a slot from one scheduler that enforces a global
+concurrency cap and a per-host cap. Search API calls (Google, Semantic
+Scholar) bypass it, so they are not capped like a single publisher's pages.
+When downloads have to wait, slots are handed out round-robin between
+research runs (run owners), so one run with many URLs cannot starve the
+others or flood a single publisher.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict, defaultdict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+from urllib.parse import urlparse
+
+from app.config import get_settings
+from app.metrics import FETCH_ACTIVE, FETCH_QUEUE_WAIT, FETCH_QUEUED
+from app.request_context import run_owner
+
+
+class FetchScheduler:
+    """
+    Global and per-host concurrency limits with fair queuing between owners.
+
+    Waiters are kept in one FIFO queue per owner. When a slot frees up, the
+    owners are visited round-robin and the first waiter whose host is below
+    its limit is admitted.
+    """
+
+    def __init__(self, max_concurrent: int = 50, per_host_limit: int = 6):
+        self.max_concurrent = max_concurrent
+        self.per_host_limit = per_host_limit
+        self._active = 0
+        self._active_by_host: defaultdict[str, int] = defaultdict(int)
+        self._waiters: OrderedDict[str, deque[tuple[str, asyncio.Future]]] = OrderedDict()
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def _has_capacity(self, host: str) -> bool:
+        return (
+            self._active < self.max_concurrent
+            and self._active_by_host.get(host, 0) < self.per_host_limit
+        )
+
+    def _acquire(self, host: str) -> None:
+        self._active += 1
+        self._active_by_host[host] += 1
+        FETCH_ACTIVE.inc()
+
+    def _release(self, host: str) -> None:
+        self._active -= 1
+        self._active_by_host[host] -= 1
+        if not self._active_by_host[host]:
+            del self._active_by_host[host]
+        FETCH_ACTIVE.dec()
+
+    def _dispatch(self) -> None:
+        """Admit waiters round-robin across owners while capacity remains."""
+        while self._active < self.max_concurrent and self._waiters:
+            admitted = False
+            for owner in list(self._waiters):
+                queue = self._waiters[owner]
+                for waiter in list(queue):
+                    host, future = waiter
+                    if future.cancelled():
+                        queue.remove(waiter)  # Its task is about to unwind
+                    elif self._active_by_host.get(host, 0) < self.per_host_limit:
+                        queue.remove(waiter)
+                        self._acquire(host)
+                        future.set_result(None)
+                        admitted = True
+                        break
+                if not queue:
+                    del self._waiters[owner]
+                elif admitted:
+                    # This owner goes to the back of the line
+                    self._waiters.move_to_end(owner)
+                if admitted:
+                    break
+            if not admitted:
+                return  # Every waiter is blocked on a busy host
+
+    def _discard(self, owner: str, waiter: tuple[str, asyncio.Future]) -> None:
+        queue = self._waiters.get(owner)
+        if queue is not None and waiter in queue:
+            queue.remove(waiter)
+            if not queue:
+                del self._waiters[owner]
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """Hold a fetch slot for the host of `url` for the duration of the block."""
+        host = self._host(url)
+        owner = run_owner.get()
+        start = time.perf_counter()
+
+        if not self._waiters and self._has_capacity(host):
+            self._acquire(host)
+        else:
+            waiter = (host, asyncio.get_running_loop().create_future())
+            self._waiters.setdefault(owner, deque()).append(waiter)
+            self._dispatch()  # Admits us right away if only other hosts are saturated
+            FETCH_QUEUED.inc()
+            try:
+                await waiter[1]
+            except asyncio.CancelledError:
+                if waiter[1].done() and not waiter[1].cancelled():
+                    # Admitted just as we were cancelled: hand the slot on
+                    self._release(host)
+                    self._dispatch()
+                else:
+                    self._discard(owner, waiter)
+                raise
+            finally:
+                FETCH_QUEUED.dec()
+
+        FETCH_QUEUE_WAIT.observe(time.perf_counter() - start)
+        try:
+            yield
+        finally:
+            self._release(host)
+            self._dispatch()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "per_host_limit": self.per_host_limit,
+            "active": self._active,
+            "queued": sum(len(queue) for queue in self._waiters.values()),
+            "waiting_owners": len(self._waiters),
+            "busiest_hosts": dict(
+                sorted(self._active_by_host.items(), key=lambda item: -item[1])[:5]
+            ),
+        }
+
+
+# Singleton scheduler
+_fetch_scheduler_instance: Optional[FetchScheduler] = None
+
+
+def get_fetch_scheduler() -> FetchScheduler:
+    """Get the process-wide fetch scheduler."""
+    global _fetch_scheduler_instance
+    if _fetch_scheduler_instance is None:
+        settings = get_settings()
+        _fetch_scheduler_instance = FetchScheduler(
+            max_concurrent=settings.fetch_max_concurrency,
+            per_host_limit=settings.http_per_host_limit,
+        )
+    return _fetch_scheduler_instance
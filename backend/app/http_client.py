@@ -0,0 +1,137 @@
+"""Shared pooled HTTP client for outbound tool requests.
+
+All tools (web search, academic search, content extraction) go through one
+application-scoped `httpx.AsyncClient`, so TCP/TLS connections are pooled and
+kept alive across requests instead of being re-established on every call.
+"""
+
+from contextlib import asynccontextmanager, nullcontext
+from typing import Any, AsyncIterator, Optional
+
+import httpx
+
+from app.config import get_settings
+from app.fetch_scheduler import get_fetch_scheduler
+from app.metrics import FETCH_RESPONSES
+
+
+class HTTPClientManager:
+    """
+    Owns the shared `httpx.AsyncClient`.
+
+    Features:
+    - Connection pooling with keep-alive
+    - HTTP/2 when the optional `h2` package is installed
+    - Global and per-host concurrency limits via the fetch scheduler for
+      page downloads (`scheduled=True`); search API calls skip them
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and _h2_available()
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared client, created on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(limits=self.limits, http2=self.http2)
+        return self._client
+
+    @staticmethod
+    def _record(response: Optional[httpx.Response]) -> None:
+        if response is None:
+            FETCH_RESPONSES.inc(status="error")
+        elif response.status_code == 429:
+            FETCH_RESPONSES.inc(status="429")
+        else:
+            FETCH_RESPONSES.inc(status=f"{response.status_code // 100}xx")
+
+    @staticmethod
+    def _slot(url: str, scheduled: bool):
+        return get_fetch_scheduler().slot(url) if scheduled else nullcontext()
+
+    async def get(self, url: str, scheduled: bool = False, **kwargs: Any) -> httpx.Response:
+        """GET `url` on the shared client, once the scheduler grants a slot if `scheduled`."""
+        async with self._slot(url, scheduled):
+            try:
+                response = await self.client.get(url, **kwargs)
+            except httpx.HTTPError:
+                self._record(None)
+                raise
+            self._record(response)
+            return response
+
+    @asynccontextmanager
+    async def stream(
+        self, url: str, scheduled: bool = False, **kwargs: Any
+    ) -> AsyncIterator[httpx.Response]:
+        """Stream a GET of `url`; see `get`."""
+        async with self._slot(url, scheduled):
+            response = None
+            try:
+                async with self.client.stream("GET", url, **kwargs) as response:
+                    self._record(response)
+                    yield response
+            except httpx.TransportError:
+                if response is None:
+                    self._record(None)  # Failed before any response arrived
+                raise
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+        }
+
+
+def _h2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        print("⚠️ h2 not installed, shared HTTP client falls back to HTTP/1.1. Run: pip install httpx[http2]")
+        return False
+    return True
+
+
+# Singleton client manager
+_http_client_instance: Optional[HTTPClientManager] = None
+
+
+def get_http_client() -> HTTPClientManager:
+    """Get the shared HTTP client manager."""
+    global _http_client_instance
+    if _http_client_instance is None:
+        settings = get_settings()
+        _http_client_instance = HTTPClientManager(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry_seconds,
+            http2=settings.http2_enabled,
+        )
+    return _http_client_instance
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (called on application shutdown)."""
+    global _http_client_instance
+    if _http_client_instance is not None:
+        await _http_client_instance.aclose()
+        _http_client_instance = None
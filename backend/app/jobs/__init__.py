@@ -0,0 +1,10 @@
+"""Background research jobs package."""
+
+from .research_jobs import QueueFullError, ResearchJob, ResearchJobQueue, get_job_queue
+
+__all__ = [
+    "QueueFullError",
+    "ResearchJob",
+    "ResearchJobQueue",
+    "get_job_queue",
+]
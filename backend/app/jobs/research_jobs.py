@@ -0,0 +1,179 @@
+"""Background research jobs executed by a bounded worker pool."""
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import AsyncIterator, Callable, Optional
+
+from cachetools import TTLCache
+
+from app.cache.single_flight import InFlightRun
+from app.config import get_settings
+from app.metrics import JOBS_QUEUED, JOBS_RUNNING
+from app.models import ResearchJobStatus, ResearchRequest
+
+ResearchRunner = Callable[[str, str, bool, Optional[float]], AsyncIterator[dict]]
+
+
+class QueueFullError(Exception):
+    """Raised when the job queue has no room for another job."""
+
+
+class ResearchJob:
+    """A queued research request with a replayable event log."""
+
+    def __init__(self, request: ResearchRequest):
+        self.id = uuid.uuid4().hex
+        self.request = request
+        self.status = ResearchJobStatus.QUEUED
+        self.created_at = datetime.utcnow()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.log = InFlightRun(key=self.id)
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "topic": self.request.topic,
+            "depth": self.request.depth,
+            "include_academic": self.request.include_academic,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "events": len(self.log.events),
+        }
+
+
+class ResearchJobQueue:
+    """
+    Admission-controlled queue of research jobs.
+
+    A fixed number of async workers pull jobs from a bounded queue, so the
+    number of concurrent research pipelines is sized to LLM capacity rather
+    than to the number of connected clients. Events are recorded per job and
+    can be streamed (and replayed) independently of the submitting client.
+
+    Pipelines started by the streaming endpoint take the same pipeline slots
+    (`pipeline_slot`), so background and streamed research together never run
+    more than `workers` pipelines at once.
+    """
+
+    def __init__(self, workers: int = 4, max_queued: int = 100, job_ttl_minutes: int = 60):
+        self.num_workers = workers
+        self.queue: asyncio.Queue[ResearchJob] = asyncio.Queue(maxsize=max_queued)
+        self.jobs: TTLCache = TTLCache(maxsize=max_queued * 10, ttl=job_ttl_minutes * 60)
+        self._workers: list[asyncio.Task] = []
+        self._runner: Optional[ResearchRunner] = None
+        self._pipelines = asyncio.Semaphore(workers)
+        self.pipelines_active = 0
+
+    def pipelines_full(self) -> bool:
+        """Whether a new pipeline would have to wait for a slot."""
+        return self._pipelines.locked()
+
+    @asynccontextmanager
+    async def pipeline_slot(self) -> AsyncIterator[None]:
+        """Hold one of the `workers` research pipeline slots."""
+        async with self._pipelines:
+            self.pipelines_active += 1
+            try:
+                yield
+            finally:
+                self.pipelines_active -= 1
+
+    def start(self, runner: ResearchRunner) -> None:
+        """Start the worker pool using `runner` to execute each job."""
+        self._runner = runner
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"research-worker-{i}")
+            for i in range(self.num_workers)
+        ]
+
+    async def stop(self) -> None:
+        """Cancel the worker pool."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def submit(self, request: ResearchRequest) -> ResearchJob:
+        """Queue a research request. Raises QueueFullError when at capacity."""
+        job = ResearchJob(request)
+        try:
+            self.queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise QueueFullError("Research queue is full, please retry later")
+        JOBS_QUEUED.inc()
+        self.jobs[job.id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[ResearchJob]:
+        """Look up a job by id."""
+        return self.jobs.get(job_id)
+
+    async def _worker(self) -> None:
+        """Execute queued jobs one at a time."""
+        while True:
+            job = await self.queue.get()
+            JOBS_QUEUED.dec()
+            JOBS_RUNNING.inc()
+            try:
+                await self._execute(job)
+            finally:
+                JOBS_RUNNING.dec()
+                self.queue.task_done()
+
+    async def _execute(self, job: ResearchJob) -> None:
+        job.status = ResearchJobStatus.RUNNING
+        job.started_at = datetime.utcnow()
+        failed = False
+
+        try:
+            async for event in self._runner(
+                job.request.topic,
+                job.request.depth,
+                job.request.include_academic,
+                job.request.time_budget_seconds,
+            ):
+                failed = failed or event.get("event") == "error"
+                await job.log.publish(event)
+        except Exception as e:
+            print(f"❌ Research job {job.id} failed: {type(e).__name__}: {str(e)}")
+            failed = True
+        finally:
+            job.status = ResearchJobStatus.FAILED if failed else ResearchJobStatus.COMPLETED
+            job.finished_at = datetime.utcnow()
+            await job.log.close()
+
+    def stats(self) -> dict:
+        """Get queue statistics."""
+        running = sum(
+            1 for job in self.jobs.values() if job.status == ResearchJobStatus.RUNNING
+        )
+        return {
+            "workers": self.num_workers,
+            "queued": self.queue.qsize(),
+            "max_queued": self.queue.maxsize,
+            "running": running,
+            "pipelines_active": self.pipelines_active,
+            "tracked_jobs": len(self.jobs),
+        }
+
+
+# Singleton queue instance
+_job_queue_instance: Optional[ResearchJobQueue] = None
+
+
+def get_job_queue() -> ResearchJobQueue:
+    """Get the singleton research job queue."""
+    global _job_queue_instance
+    if _job_queue_instance is None:
+        settings = get_settings()
+        _job_queue_instance = ResearchJobQueue(
+            workers=settings.research_workers,
+            max_queued=settings.research_queue_size,
+            job_ttl_minutes=settings.research_job_ttl_minutes,
+        )
+    return _job_queue_instance
@@ -8,8 +8,10 @@ Supports:
 from functools import lru_cache
 
 from langchain_core.language_models import BaseChatModel
+from langchain_core.runnables import Runnable
 
 from app.config import get_settings
+from app.llm_scheduler import ScheduledChatModel
 
 
 @lru_cache
@@ -21,15 +23,18 @@ def get_llm() -> BaseChatModel:
     1. Ollama - Local inference via ollama serve
     2. vLLM - OpenAI-compatible API (self-hosted or cloud)
 
+    Async calls go through the process-wide LLM scheduler, which caps the
+    calls in flight on the model server (see `app.llm_scheduler`).
+
     Returns:
         BaseChatModel: Configured LangChain chat model
     """
     settings = get_settings()
 
     if settings.llm_provider == "ollama":
-        return _create_ollama_llm(settings)
+        return ScheduledChatModel(llm=_create_ollama_llm(settings))
     elif settings.llm_provider == "vllm":
-        return _create_vllm_llm(settings)
+        return ScheduledChatModel(llm=_create_vllm_llm(settings))
     else:
         raise ValueError(
             f"Unknown LLM provider: {settings.llm_provider}. "
@@ -62,6 +67,14 @@ def _create_vllm_llm(settings) -> BaseChatModel:
     )
 
 
+def limit_output(llm: BaseChatModel, max_tokens: int) -> Runnable:
+    """`llm` with each reply capped at `max_tokens` tokens, in the provider's own option."""
+    model = llm.llm if isinstance(llm, ScheduledChatModel) else llm
+    # Ollama calls the limit num_predict; OpenAI-compatible servers call it max_tokens
+    option = "num_predict" if hasattr(model, "num_predict") else "max_tokens"
+    return llm.bind(**{option: max_tokens})
+
+
 def check_llm_health() -> dict:
     """Check if the LLM provider is accessible."""
     settings = get_settings()
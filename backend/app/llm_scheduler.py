@@ -0,0 +1,228 @@
+"""Process-wide scheduling of LLM calls.
+
+Every LLM call made through `get_llm()` takes a slot from one scheduler that
+caps the calls in flight on the model server. Waiting calls are admitted by
+priority (the briefing synthesis a user is waiting on goes before per-source
+summaries), and round-robin between research runs within a priority, so one
+deep research run cannot starve the others.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Iterator, List, Optional
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+
+from app.config import get_settings
+from app.metrics import LLM_ACTIVE, LLM_QUEUE_WAIT, LLM_QUEUED
+from app.request_context import run_owner
+
+# Lower values are admitted first
+PRIORITIES = {
+    "synthesis": 0,
+    "query_expansion": 1,
+    "default": 2,
+    "summary": 3,
+}
+
+
+class LLMScheduler:
+    """
+    Global cap on in-flight LLM calls with priorities and fair queuing.
+
+    Waiters are kept in one FIFO queue per (priority, owner). When a slot
+    frees up, the most urgent priority with waiters is served, visiting its
+    owners round-robin.
+    """
+
+    def __init__(self, max_concurrent: int = 8):
+        self.max_concurrent = max_concurrent
+        self._active = 0
+        # priority -> owner -> waiting futures
+        self._waiters: dict[int, OrderedDict[str, deque[asyncio.Future]]] = {}
+
+    def _acquire(self) -> None:
+        self._active += 1
+        LLM_ACTIVE.inc()
+
+    def _release(self) -> None:
+        self._active -= 1
+        LLM_ACTIVE.dec()
+
+    def _dispatch(self) -> None:
+        """Admit waiters, most urgent priority first, while capacity remains."""
+        while self._active < self.max_concurrent and self._waiters:
+            level = min(self._waiters)
+            owners = self._waiters[level]
+            owner, queue = next(iter(owners.items()))
+            future = queue.popleft()
+            if not queue:
+                del owners[owner]
+            else:
+                # This owner goes to the back of the line
+                owners.move_to_end(owner)
+            if not owners:
+                del self._waiters[level]
+            if future.cancelled():
+                continue  # Its task is about to unwind
+            self._acquire()
+            future.set_result(None)
+
+    def _discard(self, level: int, owner: str, future: asyncio.Future) -> None:
+        owners = self._waiters.get(level)
+        queue = owners.get(owner) if owners else None
+        if queue is not None and future in queue:
+            queue.remove(future)
+            if not queue:
+                del owners[owner]
+            if not owners:
+                del self._waiters[level]
+
+    @asynccontextmanager
+    async def slot(self, priority: str = "default") -> AsyncIterator[None]:
+        """Hold an LLM slot for the duration of the block."""
+        level = PRIORITIES.get(priority, PRIORITIES["default"])
+        owner = run_owner.get()
+        start = time.perf_counter()
+
+        if not self._waiters and self._active < self.max_concurrent:
+            self._acquire()
+        else:
+            future = asyncio.get_running_loop().create_future()
+            owners = self._waiters.setdefault(level, OrderedDict())
+            owners.setdefault(owner, deque()).append(future)
+            LLM_QUEUED.inc(priority=priority)
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # Admitted just as we were cancelled: hand the slot on
+                    self._release()
+                    self._dispatch()
+                else:
+                    self._discard(level, owner, future)
+                raise
+            finally:
+                LLM_QUEUED.dec(priority=priority)
+
+        LLM_QUEUE_WAIT.observe(time.perf_counter() - start, priority=priority)
+        try:
+            yield
+        finally:
+            self._release()
+            self._dispatch()
+
+    def stats(self) -> dict[str, Any]:
+        names = {level: name for name, level in PRIORITIES.items()}
+        return {
+            "max_concurrent": self.max_concurrent,
+            "active": self._active,
+            "queued": {
+                names[level]: sum(len(queue) for queue in owners.values())
+                for level, owners in sorted(self._waiters.items())
+            },
+        }
+
+
+# Singleton scheduler
+_llm_scheduler_instance: Optional[LLMScheduler] = None
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """Get the process-wide LLM scheduler."""
+    global _llm_scheduler_instance
+    if _llm_scheduler_instance is None:
+        _llm_scheduler_instance = LLMScheduler(
+            max_concurrent=get_settings().llm_max_concurrency,
+        )
+    return _llm_scheduler_instance
+
+
+class ScheduledChatModel(BaseChatModel):
+    """
+    Chat model that runs every async call of `llm` inside a scheduler slot.
+
+    Streaming calls hold their slot until the stream ends. Synchronous calls
+    (only the health check) bypass the scheduler.
+    """
+
+    llm: BaseChatModel
+    priority: str = "default"
+
+    @property
+    def _llm_type(self) -> str:
+        return f"scheduled-{self.llm._llm_type}"
+
+    @property
+    def model_name(self) -> str:
+        return getattr(self.llm, "model_name", None) or getattr(self.llm, "model", "unknown")
+
+    def with_priority(self, priority: str) -> "ScheduledChatModel":
+        """The same model, scheduled at `priority`."""
+        return ScheduledChatModel(llm=self.llm, priority=priority)
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return self.llm._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        async with get_llm_scheduler().slot(self.priority):
+            return await self.llm._agenerate(
+                messages, stop=stop, run_manager=run_manager, **kwargs
+            )
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        return self.llm._stream(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        if (
+            type(self.llm)._astream is BaseChatModel._astream
+            and type(self.llm)._stream is BaseChatModel._stream
+        ):
+            # The wrapped model cannot stream: yield its whole reply at once
+            result = await self._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            yield ChatGenerationChunk(
+                message=AIMessageChunk(content=result.generations[0].message.content)
+            )
+            return
+
+        async with get_llm_scheduler().slot(self.priority):
+            async for chunk in self.llm._astream(
+                messages, stop=stop, run_manager=run_manager, **kwargs
+            ):
+                yield chunk
+
+
+def prioritize(llm: BaseChatModel, priority: str) -> BaseChatModel:
+    """`llm` scheduled at `priority`, if it goes through the scheduler."""
+    if isinstance(llm, ScheduledChatModel):
+        return llm.with_priority(priority)
+    return llm
@@ -9,10 +9,16 @@ from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from app.agents import get_research_agent
 from app.api import router
-from app.api.routes import limiter
+from app.api.routes import limiter, stream_research
 from app.config import get_settings
+from app.cache import get_content_store, get_summary_cache
 from app.db import init_db
+from app.http_client import close_http_client, get_http_client
+from app.jobs import get_job_queue
+from app.tools.credibility_model import get_credibility_model_store
+from app.tools.html_parser import get_html_parser, shutdown_html_parser
 
 
 class CORSErrorMiddleware(BaseHTTPMiddleware):
@@ -73,13 +79,39 @@ async def lifespan(app: FastAPI):
     print("   Initializing database...")
     await init_db()
     print("   ✓ Database ready")
+    purged = await get_content_store().purge()
+    print(f"   ✓ Extracted page store ready ({purged} expired pages purged)")
+    evicted = await get_summary_cache().evict()
+    print(f"   ✓ Summary cache ready ({evicted} summaries evicted)")
     print("   ✓ Rate limiting enabled (10/min, 100/hour)")
     print("   ✓ Response caching enabled (24h TTL)")
+
+    # Open the shared outbound HTTP connection pool
+    http_client = get_http_client()
+    print(f"   ✓ HTTP client pool ready (HTTP/2: {http_client.http2})")
+
+    credibility = get_credibility_model_store().current()
+    print(f"   ✓ Credibility table loaded (version {credibility.version}, {len(credibility)} entries)")
+
+    html_parser = get_html_parser()
+    print(f"   ✓ HTML parser pool ready ({html_parser.backend}, {html_parser.workers} workers)")
+
+    # Build the shared research agent (tools and chains) once
+    get_research_agent()
+    print("   ✓ Research agent ready")
+
+    # Start background research workers
+    job_queue = get_job_queue()
+    job_queue.start(stream_research)
+    print(f"   ✓ Research job workers started ({settings.research_workers})")
     
     yield
     
     # Shutdown
     print("👋 Research Agent API shutting down...")
+    await job_queue.stop()
+    await close_http_client()
+    shutdown_html_parser()
 
 
 def create_app() -> FastAPI:
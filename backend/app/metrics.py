@@ -0,0 +1,329 @@
+"""Lightweight Prometheus-style metrics.
+
+Counters, gauges and histograms are registered once at import time and
+rendered in the Prometheus text exposition format at `/api/metrics`.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 15.0, 30.0, 60.0, 120.0)
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    parts = []
+    for name, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{name}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    """Base class holding one value series per label combination."""
+
+    type_name = ""
+
+    def __init__(self, name: str, description: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._series: dict[tuple, object] = {}
+
+    def _key(self, labels: dict[str, str]) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Metric {self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: tuple) -> dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        with self._lock:
+            series = dict(self._series)
+        for key, value in sorted(series.items()):
+            lines.extend(self._render_series(self._labels(key), value))
+        return lines
+
+    def _render_series(self, labels: dict[str, str], value) -> list[str]:
+        return [f"{self.name}{_format_labels(labels)} {_format_value(value)}"]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    type_name = "counter"
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._series.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = value
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._series.get(self._key(labels), 0)
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, description, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {
+                    "counts": [0] * len(self.buckets),
+                    "sum": 0.0,
+                    "count": 0,
+                }
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series["counts"][i] += 1
+            series["sum"] += value
+            series["count"] += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the wall-clock duration of the enclosed block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def _render_series(self, labels: dict[str, str], series) -> list[str]:
+        lines = []
+        for bound, count in zip(self.buckets, series["counts"]):
+            bucket_labels = {**labels, "le": _format_value(bound)}
+            lines.append(f"{self.name}_bucket{_format_labels(bucket_labels)} {count}")
+        lines.append(f"{self.name}_sum{_format_labels(labels)} {series['sum']!r}")
+        lines.append(f"{self.name}_count{_format_labels(labels)} {series['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, description: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, description, labelnames))
+
+    def gauge(self, name: str, description: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, description, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, description, labelnames, buckets))
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# Research pipeline
+STAGE_LATENCY = REGISTRY.histogram(
+    "research_stage_duration_seconds",
+    "Duration of each research pipeline stage (extract/summarize are per source).",
+    ("stage",),
+)
+RESEARCH_LATENCY = REGISTRY.histogram(
+    "research_duration_seconds",
+    "End-to-end duration of completed research runs.",
+    ("depth",),
+)
+ERRORS = REGISTRY.counter(
+    "research_errors_total",
+    "Errors raised by research pipeline stages.",
+    ("stage",),
+)
+DUPLICATE_SOURCES = REGISTRY.counter(
+    "research_duplicate_sources_total",
+    "Extracted pages found to be near-duplicates of a page already kept.",
+)
+TIMEOUTS = REGISTRY.counter(
+    "research_timeouts_total",
+    "Outbound requests that timed out.",
+    ("target",),
+)
+
+# Outbound fetches
+FETCH_ACTIVE = REGISTRY.gauge(
+    "fetch_active",
+    "Outbound requests currently holding a fetch scheduler slot.",
+)
+FETCH_QUEUED = REGISTRY.gauge(
+    "fetch_queued",
+    "Outbound requests waiting for a fetch scheduler slot.",
+)
+FETCH_QUEUE_WAIT = REGISTRY.histogram(
+    "fetch_queue_wait_seconds",
+    "Time outbound requests waited for a fetch scheduler slot.",
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+FETCH_RESPONSES = REGISTRY.counter(
+    "fetch_responses_total",
+    "Outbound responses by status class (429 counted separately; error = no response).",
+    ("status",),
+)
+
+FETCH_SHORT_CIRCUITED = REGISTRY.counter(
+    "fetch_short_circuited_total",
+    "Fetches skipped because the URL recently failed or its domain circuit is open.",
+    ("scope",),
+)
+CIRCUITS_OPEN = REGISTRY.gauge(
+    "fetch_circuits_open",
+    "Domains whose circuit breaker is open or half-open.",
+)
+
+# LLM scheduling
+LLM_ACTIVE = REGISTRY.gauge(
+    "llm_requests_active",
+    "LLM calls currently holding an LLM scheduler slot.",
+)
+LLM_QUEUED = REGISTRY.gauge(
+    "llm_requests_queued",
+    "LLM calls waiting for an LLM scheduler slot.",
+    ("priority",),
+)
+LLM_QUEUE_WAIT = REGISTRY.histogram(
+    "llm_queue_wait_seconds",
+    "Time LLM calls waited for an LLM scheduler slot.",
+    ("priority",),
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+# Content extraction
+EXTRACT_DOWNLOADS = REGISTRY.counter(
+    "extract_downloads_total",
+    "Page downloads by outcome (complete, truncated at the byte limit, rejected by size or type).",
+    ("outcome",),
+)
+
+# HTML parsing
+HTML_PARSE_LATENCY = REGISTRY.histogram(
+    "html_parse_duration_seconds",
+    "Time spent converting a page's HTML to text (excluding queue wait).",
+    ("backend", "engine"),
+)
+HTML_PARSE_QUEUE = REGISTRY.gauge(
+    "html_parse_queued",
+    "Pages waiting for a free worker in the HTML parser pool.",
+)
+HTML_PARSE_ACTIVE = REGISTRY.gauge(
+    "html_parse_active",
+    "Pages being parsed in the HTML parser pool.",
+)
+
+# Credibility scoring
+CREDIBILITY_LOOKUPS = REGISTRY.counter(
+    "credibility_domain_lookups_total",
+    "Per-host credibility base score lookups (memoized hit or table miss).",
+    ("result",),
+)
+CREDIBILITY_RELOADS = REGISTRY.counter(
+    "credibility_table_reloads_total",
+    "Credibility table loads from its data file (success, or error keeping the previous table).",
+    ("outcome",),
+)
+CREDIBILITY_TABLE_ENTRIES = REGISTRY.gauge(
+    "credibility_table_entries",
+    "Domain and suffix entries in the active credibility table.",
+)
+
+# Caching
+CACHE_REQUESTS = REGISTRY.counter(
+    "research_cache_requests_total",
+    "Research result cache lookups.",
+    ("result",),
+)
+CONTENT_STORE_REQUESTS = REGISTRY.counter(
+    "content_store_requests_total",
+    "Extracted page lookups (hit, revalidated with a 304, or miss).",
+    ("result",),
+)
+SUMMARY_CACHE_REQUESTS = REGISTRY.counter(
+    "summary_cache_requests_total",
+    "Source summary cache lookups.",
+    ("result",),
+)
+
+# Background jobs
+JOBS_QUEUED = REGISTRY.gauge(
+    "research_jobs_queued",
+    "Background research jobs waiting for a worker.",
+)
+JOBS_RUNNING = REGISTRY.gauge(
+    "research_jobs_running",
+    "Background research jobs currently executing.",
+)
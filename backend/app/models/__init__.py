@@ -1,14 +1,20 @@
 """Models package."""
 
 from .schemas import (
+    BriefingDelta,
     ChatMessage,
     ConversationCreate,
+    CredibilityScore,
+    CredibilityScoreRequest,
+    CredibilityScoreResponse,
     ConversationListItem,
     ConversationResponse,
     ConversationUpdate,
     MessageCreate,
     MessageResponse,
     PDFExportRequest,
+    ResearchJobResponse,
+    ResearchJobStatus,
     ResearchProgress,
     ResearchRequest,
     ResearchResult,
@@ -18,14 +24,20 @@ from .schemas import (
 )
 
 __all__ = [
+    "BriefingDelta",
     "ChatMessage",
     "ConversationCreate",
+    "CredibilityScore",
+    "CredibilityScoreRequest",
+    "CredibilityScoreResponse",
     "ConversationListItem",
     "ConversationResponse",
     "ConversationUpdate",
     "MessageCreate",
     "MessageResponse",
     "PDFExportRequest",
+    "ResearchJobResponse",
+    "ResearchJobStatus",
     "ResearchProgress",
     "ResearchRequest",
     "ResearchResult",
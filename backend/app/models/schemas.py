@@ -19,6 +19,15 @@ class ResearchStatus(str, Enum):
     ERROR = "error"
 
 
+class ResearchJobStatus(str, Enum):
+    """Background research job status."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
 class Source(BaseModel):
     """A research source with metadata."""
 
@@ -36,6 +45,26 @@ class ResearchRequest(BaseModel):
     topic: str = Field(..., min_length=3, max_length=500)
     depth: str = Field(default="standard", pattern="^(quick|standard|deep)$")
     include_academic: bool = Field(default=False, description="Include academic sources")
+    time_budget_seconds: Optional[float] = Field(
+        default=None,
+        ge=5.0,
+        le=600.0,
+        description="Overall time budget; work is shed to return a briefing on time",
+    )
+
+
+class ResearchJobResponse(BaseModel):
+    """State of a background research job."""
+
+    job_id: str
+    status: ResearchJobStatus
+    topic: str
+    depth: str
+    include_academic: bool
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    events: int = 0
 
 
 class StreamEvent(BaseModel):
@@ -56,6 +85,12 @@ class ResearchProgress(BaseModel):
     sources_processed: int = 0
 
 
+class BriefingDelta(BaseModel):
+    """Incremental chunk of the briefing while it is being synthesized."""
+
+    delta: str
+
+
 class ResearchResult(BaseModel):
     """Final research result."""
 
@@ -64,6 +99,7 @@ class ResearchResult(BaseModel):
     sources: list[Source]
     total_time_seconds: float
     model_used: str
+    degraded: bool = False  # True if work was shed to meet the time budget
 
 
 class ChatMessage(BaseModel):
@@ -152,3 +188,25 @@ class PDFExportRequest(BaseModel):
     sources: list[Source]
     total_time_seconds: float
     model_used: str
+
+
+# Credibility schemas
+class CredibilityScoreRequest(BaseModel):
+    """Request to score a batch of URLs for credibility."""
+
+    urls: list[str] = Field(..., min_length=1, max_length=1000)
+
+
+class CredibilityScore(BaseModel):
+    """Credibility score of a single URL."""
+
+    url: str
+    score: float
+    credible: bool = Field(description="Score meets the minimum used to keep sources")
+
+
+class CredibilityScoreResponse(BaseModel):
+    """Credibility scores, in request order with duplicates removed."""
+
+    version: str = Field(description="Version of the credibility table used")
+    scores: list[CredibilityScore]
@@ -0,0 +1,6 @@
+"""Per-run context shared by the process-wide schedulers."""
+
+from contextvars import ContextVar
+
+# Identifies the research run a fetch or LLM call belongs to, for fair queuing
+run_owner: ContextVar[str] = ContextVar("run_owner", default="default")
@@ -4,9 +4,11 @@ import asyncio
 from typing import Any
 
 import httpx
+from langchain_core.pydantic_v1 import Field
 from langchain_core.tools import BaseTool
-from pydantic import Field
 
+from app.http_client import get_http_client
+from app.metrics import TIMEOUTS
 from app.models import Source
 
 
@@ -61,8 +63,11 @@ class AcademicSearchTool(BaseTool):
                 sort_by=arxiv.SortCriterion.Relevance,
             )
             
+            # The arxiv client is blocking, so run it off the event loop
+            papers = await asyncio.to_thread(lambda: list(search.results()))
+
             results = []
-            for paper in search.results():
+            for paper in papers:
                 results.append({
                     "url": paper.entry_id,
                     "title": paper.title,
@@ -85,42 +90,43 @@ class AcademicSearchTool(BaseTool):
     async def _search_semantic_scholar(self, query: str) -> list[dict[str, Any]]:
         """Search Semantic Scholar API."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    "https://api.semanticscholar.org/graph/v1/paper/search",
-                    params={
-                        "query": query,
-                        "limit": self.max_results // 2,
-                        "fields": "title,abstract,url,authors,year",
-                    },
-                    headers={
-                        "User-Agent": "ResearchAgent/1.0",
-                    },
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                results = []
-                for paper in data.get("data", []):
-                    abstract = paper.get("abstract", "")
-                    if abstract and len(abstract) > 500:
-                        abstract = abstract[:500] + "..."
-                    
-                    authors = paper.get("authors", [])
-                    author_names = ", ".join(a.get("name", "") for a in authors[:3])
-                    
-                    results.append({
-                        "url": paper.get("url") or f"https://www.semanticscholar.org/paper/{paper.get('paperId', '')}",
-                        "title": paper.get("title", "Untitled"),
-                        "snippet": abstract or "No abstract available.",
-                        "source": "semantic_scholar",
-                        "authors": author_names,
-                        "published": str(paper.get("year")) if paper.get("year") else None,
-                    })
+            response = await get_http_client().get(
+                "https://api.semanticscholar.org/graph/v1/paper/search",
+                timeout=self.timeout,
+                params={
+                    "query": query,
+                    "limit": self.max_results // 2,
+                    "fields": "title,abstract,url,authors,year",
+                },
+                headers={
+                    "User-Agent": "ResearchAgent/1.0",
+                },
+            )
+            response.raise_for_status()
+            data = response.json()
+            
+            results = []
+            for paper in data.get("data", []):
+                abstract = paper.get("abstract", "")
+                if abstract and len(abstract) > 500:
+                    abstract = abstract[:500] + "..."
                 
-                return results
+                authors = paper.get("authors", [])
+                author_names = ", ".join(a.get("name", "") for a in authors[:3])
                 
+                results.append({
+                    "url": paper.get("url") or f"https://www.semanticscholar.org/paper/{paper.get('paperId', '')}",
+                    "title": paper.get("title", "Untitled"),
+                    "snippet": abstract or "No abstract available.",
+                    "source": "semantic_scholar",
+                    "authors": author_names,
+                    "published": str(paper.get("year")) if paper.get("year") else None,
+                })
+            
+            return results
+            
         except httpx.TimeoutException:
+            TIMEOUTS.inc(target="semantic_scholar")
             return [{
                 "url": "",
                 "title": "Semantic Scholar Timeout",
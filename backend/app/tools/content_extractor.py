@@ -1,13 +1,280 @@
 """Content extraction tool for web pages."""
 
 import asyncio
+import codecs
+import re
 from typing import Optional
 
+import html2text
 import httpx
+import lxml.html
 from bs4 import BeautifulSoup
-import html2text
+from langchain_core.pydantic_v1 import Field
 from langchain_core.tools import BaseTool
-from pydantic import Field
+from lxml.etree import ParserError
+
+from app.cache.content_store import get_content_store
+from app.cache.failure_cache import get_failure_cache
+from app.db.models import PageContent
+from app.http_client import get_http_client
+from app.metrics import EXTRACT_DOWNLOADS, TIMEOUTS
+from app.tools.html_parser import ExtractionEngine, get_html_parser
+
+
+# ============================================================================
+# Extraction engines
+# ============================================================================
+
+# Elements that never carry article content
+_STRIP_TAGS = ["script", "style", "nav", "footer", "header"]
+_NON_CONTENT_TAGS = _STRIP_TAGS + [
+    "noscript", "aside", "form", "iframe", "svg", "button", "select", "input", "template",
+]
+
+# Readability-style class/id heuristics
+_UNLIKELY = re.compile(
+    r"sidebar|comment|disqus|footer|menu|nav|share|social|related|promo|sponsor|"
+    r"advert|\bads?\b|banner|cookie|popup|modal|breadcrumb|pagination|subscribe|newsletter",
+    re.I,
+)
+_MAYBE = re.compile(r"and|article|body|column|main|content|story|post|entry", re.I)
+_POSITIVE = re.compile(r"article|body|content|entry|main|page|post|text|blog|story", re.I)
+_NEGATIVE = re.compile(
+    r"comment|meta|footer|footnote|sidebar|widget|share|related|promo|sponsor|combx|hidden",
+    re.I,
+)
+
+_PARAGRAPH_TAGS = ("p", "pre", "td", "blockquote")
+_HEADING_TAGS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+_BLOCK_TAGS = {
+    "p", "div", "section", "article", "main", "pre", "blockquote", "li", "ul", "ol",
+    "table", "tr", "td", "th", "dl", "dt", "dd", "figure", "figcaption", "br",
+    *_HEADING_TAGS,
+}
+_MIN_PARAGRAPH_CHARS = 25
+_MIN_READABLE_CHARS = 250
+_WHITESPACE = re.compile(r"\s+")
+
+
+def extract_with_html2text(html: str) -> str:
+    """Legacy engine: BeautifulSoup cleanup followed by html2text conversion."""
+    soup = BeautifulSoup(html, "html.parser")
+    for element in soup(_STRIP_TAGS):
+        element.decompose()
+
+    h = html2text.HTML2Text()
+    h.ignore_links = True
+    h.ignore_images = True
+    return h.handle(str(soup))
+
+
+def _class_weight(element) -> int:
+    weight = 0
+    for attr in (element.get("class"), element.get("id")):
+        if attr:
+            if _NEGATIVE.search(attr):
+                weight -= 25
+            if _POSITIVE.search(attr):
+                weight += 25
+    return weight
+
+
+def _tag_weight(tag: str) -> int:
+    if tag == "div":
+        return 5
+    if tag in ("pre", "td", "blockquote"):
+        return 3
+    if tag in ("form", "ol", "ul", "dl", "dd", "dt", "li", "address"):
+        return -3
+    if tag in _HEADING_TAGS or tag == "th":
+        return -5
+    return 0
+
+
+def _link_density(element) -> float:
+    text_length = len(element.text_content())
+    if not text_length:
+        return 0.0
+    link_length = sum(len(a.text_content()) for a in element.iter("a"))
+    return link_length / text_length
+
+
+def _render(element, blocks: list[str]) -> None:
+    """Append the text of `element` to `blocks` as markdown-ish paragraphs."""
+    tag = element.tag if isinstance(element.tag, str) else ""
+
+    if tag in _HEADING_TAGS or tag in ("p", "li", "blockquote", "dt", "dd", "figcaption"):
+        text = _WHITESPACE.sub(" ", element.text_content()).strip()
+        if text:
+            if tag in _HEADING_TAGS:
+                text = "#" * _HEADING_TAGS[tag] + " " + text
+            elif tag == "li":
+                text = "- " + text
+            elif tag == "blockquote":
+                text = "> " + text
+            blocks.append(text)
+        return
+    if tag == "pre":
+        text = element.text_content().strip("\n")
+        if text.strip():
+            blocks.append(text)
+        return
+
+    inline = []
+    if element.text and element.text.strip():
+        inline.append(element.text)
+    for child in element:
+        child_tag = child.tag if isinstance(child.tag, str) else ""
+        if child_tag in _BLOCK_TAGS:
+            if inline:
+                blocks.append(_WHITESPACE.sub(" ", "".join(inline)).strip())
+                inline = []
+            _render(child, blocks)
+        elif child_tag:
+            inline.append(child.text_content())
+        if child.tail and child.tail.strip():
+            inline.append(child.tail)
+    if inline:
+        text = _WHITESPACE.sub(" ", "".join(inline)).strip()
+        if text:
+            blocks.append(text)
+
+
+def extract_readable(html: str) -> str:
+    """
+    Readability-style engine built on lxml's C parser.
+
+    The page is parsed once, obvious boilerplate (navigation, sidebars,
+    comment threads, ads) is dropped, and the container whose paragraphs
+    score highest is rendered as text together with related siblings.
+    Falls back to the html2text engine when too little text survives.
+    """
+    try:
+        parser = lxml.html.HTMLParser(encoding="utf-8", remove_comments=True)
+        doc = lxml.html.document_fromstring(html.encode("utf-8", "replace"), parser=parser)
+    except (ParserError, ValueError):
+        return ""
+
+    for element in list(doc.iter(*_NON_CONTENT_TAGS)):
+        element.drop_tree()
+    for element in list(doc.iter()):
+        if not isinstance(element.tag, str) or element.tag in ("html", "body", "article", "main"):
+            continue
+        match = f"{element.get('class', '')} {element.get('id', '')}"
+        if match.strip() and _UNLIKELY.search(match) and not _MAYBE.search(match):
+            if element.getparent() is not None:
+                element.drop_tree()
+
+    # Score containers by the paragraphs they hold
+    scores: dict = {}
+    for paragraph in doc.iter(*_PARAGRAPH_TAGS):
+        text = paragraph.text_content()
+        if len(text.strip()) < _MIN_PARAGRAPH_CHARS:
+            continue
+        score = 1 + text.count(",") + min(len(text) // 100, 3)
+        parent = paragraph.getparent()
+        for ancestor, share in ((parent, 1.0), (parent.getparent() if parent is not None else None, 0.5)):
+            if ancestor is None or not isinstance(ancestor.tag, str):
+                continue
+            if ancestor not in scores:
+                scores[ancestor] = _tag_weight(ancestor.tag) + _class_weight(ancestor)
+            scores[ancestor] += score * share
+
+    body = doc.find("body")
+    if not scores:
+        top, top_score = (body if body is not None else doc), 0.0
+    else:
+        for candidate in scores:
+            scores[candidate] *= 1 - _link_density(candidate)
+        top = max(scores, key=scores.get)
+        top_score = scores[top]
+
+    # Pull in siblings that look like part of the same article
+    selected = [top]
+    parent = top.getparent()
+    if parent is not None:
+        threshold = max(10.0, top_score * 0.2)
+        selected = []
+        for sibling in parent:
+            if sibling is top or scores.get(sibling, 0) >= threshold:
+                selected.append(sibling)
+            elif sibling.tag == "p":
+                text = sibling.text_content()
+                if len(text) > 80 and _link_density(sibling) < 0.25:
+                    selected.append(sibling)
+
+    blocks: list[str] = []
+    for element in selected:
+        _render(element, blocks)
+    content = "\n\n".join(blocks)
+
+    if len(content) < _MIN_READABLE_CHARS:
+        return extract_with_html2text(html)
+    return content
+
+
+EXTRACTION_ENGINES: dict[str, ExtractionEngine] = {
+    "readability": extract_readable,
+    "html2text": extract_with_html2text,
+}
+
+
+# ============================================================================
+# Downloading
+# ============================================================================
+
+_TEXT_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+_CHARSET_HEADER = re.compile(r"charset=[\"']?([\w.:-]+)", re.I)
+_CHARSET_META = re.compile(rb"<meta[^>]+charset=[\"']?([\w.:-]+)", re.I)
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def _is_text_content(content_type: str) -> bool:
+    """Whether a Content-Type header names a page we can extract text from."""
+    if not content_type:
+        return True  # Missing header: let the parser try
+    return content_type.split(";", 1)[0].strip().lower() in _TEXT_CONTENT_TYPES
+
+
+def _known_codec(name: str) -> Optional[str]:
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+def decode_html(body: bytes, content_type: str = "") -> str:
+    """
+    Decode a page body without statistical charset detection.
+
+    The charset is taken from the Content-Type header, then a byte-order
+    mark, then a <meta charset> tag in the first 2KB, then UTF-8.
+    Undecodable bytes (including a multi-byte character cut by the download
+    limit) are replaced rather than raising.
+    """
+    encoding = None
+    match = _CHARSET_HEADER.search(content_type or "")
+    if match:
+        encoding = _known_codec(match.group(1))
+    if encoding is None:
+        for bom, name in _BOMS:
+            if body.startswith(bom):
+                encoding = name
+                break
+    if encoding is None:
+        match = _CHARSET_META.search(body[:2048])
+        if match:
+            encoding = _known_codec(match.group(1).decode("ascii", "ignore"))
+    return body.decode(encoding or "utf-8", errors="replace")
+
+
+# ============================================================================
+# Tool
+# ============================================================================
 
 
 class ContentExtractorTool(BaseTool):
@@ -19,42 +286,56 @@ class ContentExtractorTool(BaseTool):
         "Returns clean, readable text suitable for analysis."
     )
     timeout: float = Field(default=15.0)
-    max_content_length: int = Field(default=15000)
+    max_content_length: int = Field(default=100_000)  # Characters kept for summarization
+    engine: str = Field(default="readability")  # Key of EXTRACTION_ENGINES
+    max_download_bytes: int = Field(default=2_000_000)  # Stop reading the body here
 
     def _run(self, url: str) -> str:
         """Synchronous content extraction."""
         return asyncio.run(self._arun(url))
 
     async def _arun(self, url: str) -> str:
-        """Async content extraction using beautifulsoup4."""
+        """Async content extraction, served from the content store when possible."""
+        stored = await get_content_store().get(url, self.engine)
+        return await self._extract(url, stored)
+
+    async def _extract(self, url: str, stored: Optional[PageContent]) -> str:
+        """Extract `url`, reusing or revalidating a previously stored copy."""
+        store = get_content_store()
+        if stored is not None and stored.fresh:
+            store.record("hit")
+            return stored.content
+
+        # Fail fast on URLs that just failed and on domains whose circuit is open
+        failures = get_failure_cache()
+        skip_reason = failures.check(url)
+        if skip_reason:
+            return f"[Error: {skip_reason} for {url}]"
+
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                headers={
-                    "User-Agent": (
-                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                        "AppleWebKit/537.36 (KHTML, like Gecko) "
-                        "Chrome/120.0.0.0 Safari/537.36"
-                    )
-                },
-            ) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                html = response.text
-
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(html, "html.parser")
-            
-            # Remove script and style elements
-            for script in soup(["script", "style", "nav", "footer", "header"]):
-                script.decompose()
-            
-            # Get text and convert to markdown
-            h = html2text.HTML2Text()
-            h.ignore_links = True
-            h.ignore_images = True
-            content = h.handle(str(soup))
+            validators = {}
+            if stored is not None:
+                if stored.etag:
+                    validators["If-None-Match"] = stored.etag
+                if stored.last_modified:
+                    validators["If-Modified-Since"] = stored.last_modified
+
+            html, headers = await self._download(url, validators)
+            if html is None:
+                # 304 Not Modified: the stored extraction is still current
+                failures.record_success(url)
+                store.record("revalidated")
+                await store.refresh(stored, headers)
+                return stored.content
+
+            store.record("miss")
+            if html.startswith("[Error"):
+                failures.record_failure(url, "unusable response")
+                return html
+            failures.record_success(url)
+
+            # Strip boilerplate and convert to markdown off the event loop
+            content = await get_html_parser().to_text(html, EXTRACTION_ENGINES[self.engine])
 
             if not content:
                 return ""
@@ -63,24 +344,101 @@ class ContentExtractorTool(BaseTool):
             if len(content) > self.max_content_length:
                 content = content[: self.max_content_length] + "\n\n[Content truncated...]"
 
-            return content.strip()
+            content = content.strip()
+            await store.put(url, self.engine, content, headers)
+            return content
 
         except httpx.TimeoutException:
+            TIMEOUTS.inc(target="extract")
+            failures.record_failure(url, "timeout", domain_failure=True)
             return f"[Error: Request timed out for {url}]"
         except httpx.HTTPStatusError as e:
-            return f"[Error: HTTP {e.response.status_code} for {url}]"
+            status = e.response.status_code
+            # Blocks, throttling and server errors apply to the whole host
+            failures.record_failure(
+                url, f"HTTP {status}", domain_failure=status in (403, 429) or status >= 500
+            )
+            return f"[Error: HTTP {status} for {url}]"
+        except httpx.TransportError as e:
+            failures.record_failure(url, type(e).__name__, domain_failure=True)
+            return f"[Error extracting content: {str(e)}]"
         except Exception as e:
             return f"[Error extracting content: {str(e)}]"
 
+    async def _download(
+        self, url: str, validators: dict[str, str]
+    ) -> tuple[Optional[str], httpx.Headers]:
+        """
+        Stream the page body, reading at most `max_download_bytes`.
+
+        Pages that announce a non-HTML Content-Type or a Content-Length over
+        the limit are rejected before the body is read. Returns None as the
+        body when a conditional request (`validators`) was answered with 304.
+        """
+        async with get_http_client().stream(
+            url,
+            scheduled=True,
+            timeout=self.timeout,
+            follow_redirects=True,
+            headers={
+                "User-Agent": (
+                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                    "AppleWebKit/537.36 (KHTML, like Gecko) "
+                    "Chrome/120.0.0.0 Safari/537.36"
+                ),
+                **validators,
+            },
+        ) as response:
+            if response.status_code == 304 and validators:
+                return None, response.headers
+            response.raise_for_status()
+
+            content_type = response.headers.get("content-type", "")
+            if not _is_text_content(content_type):
+                EXTRACT_DOWNLOADS.inc(outcome="rejected_type")
+                return (
+                    f"[Error: Unsupported content type {content_type.split(';')[0]} for {url}]",
+                    response.headers,
+                )
+
+            content_length = response.headers.get("content-length", "")
+            if content_length.isdigit() and int(content_length) > self.max_download_bytes * 4:
+                # Far beyond the cap: not worth a connection for a truncated prefix
+                EXTRACT_DOWNLOADS.inc(outcome="rejected_size")
+                return (
+                    f"[Error: Page too large ({int(content_length) // 1024} KB) for {url}]",
+                    response.headers,
+                )
+
+            body = bytearray()
+            truncated = False
+            async for chunk in response.aiter_bytes():
+                body += chunk
+                if len(body) >= self.max_download_bytes:
+                    del body[self.max_download_bytes:]
+                    truncated = True
+                    break
+
+        EXTRACT_DOWNLOADS.inc(outcome="truncated" if truncated else "complete")
+        return decode_html(bytes(body), content_type), response.headers
+
+    async def extract(self, url: str) -> str:
+        """Extract content from a single URL."""
+        return await self._arun(url)
+
     async def extract_batch(
         self, urls: list[str], max_concurrent: int = 5
     ) -> dict[str, str]:
         """Extract content from multiple URLs concurrently."""
+        stored_pages = await get_content_store().get_many(urls, self.engine)
         semaphore = asyncio.Semaphore(max_concurrent)
 
         async def extract_with_semaphore(url: str) -> tuple[str, str]:
+            stored = stored_pages.get(url)
+            if stored is not None and stored.fresh:
+                return url, await self._extract(url, stored)
             async with semaphore:
-                content = await self._arun(url)
+                content = await self._extract(url, stored)
                 return url, content
 
         tasks = [extract_with_semaphore(url) for url in urls]
@@ -92,4 +450,4 @@ class ContentExtractorTool(BaseTool):
                 url, content = result
                 content_map[url] = content
 
-        return content_map
\ No newline at end of file
+        return content_map
@@ -0,0 +1,204 @@
+"""File-backed credibility table with hot reloading.
+
+The domain scores and URL red flags live in a versioned JSON file
+(`data/credibility.json` by default). The file is compiled into a
+`CredibilityModel`: a `DomainIndex`, one combined red-flag pattern and a
+per-host memo of base scores. When the file changes on disk, a new model is
+built and swapped in; scoring calls that already hold the previous model
+finish with it, and a file that fails to load leaves the previous model in
+place.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from cachetools import LRUCache
+
+from app.config import get_settings
+from app.metrics import CREDIBILITY_LOOKUPS, CREDIBILITY_RELOADS, CREDIBILITY_TABLE_ENTRIES
+from app.tools.domain_index import DomainIndex
+
+DEFAULT_CREDIBILITY_PATH = Path(__file__).parent / "data" / "credibility.json"
+
+
+class CredibilityModel:
+    """
+    One compiled version of the credibility table.
+
+    File format:
+        {
+          "version": "...",
+          "base_score": 0.5,          # Hosts with no matching entry
+          "red_flag_penalty": 0.7,    # Multiplier per distinct red flag in a URL
+          "red_flags": ["spam", ...], # Regular expressions, matched on the lower-cased URL;
+                                      # numbered backreferences are not supported
+          "domains": {"nature.com": 0.95, ".edu": 0.9, ...}
+        }
+    """
+
+    def __init__(
+        self,
+        scores: dict[str, float],
+        red_flags: list[str],
+        version: str = "",
+        base_score: float = 0.5,
+        red_flag_penalty: float = 0.7,
+        memo_size: int = 8192,
+    ):
+        for key, score in scores.items():
+            if not 0.0 <= score <= 1.0:
+                raise ValueError(f"Score for {key!r} must be between 0 and 1, got {score}")
+        self.version = version
+        self.scores = scores
+        self.red_flags = red_flags
+        self.base_score = base_score
+        self.red_flag_penalty = red_flag_penalty
+        self.index = DomainIndex(scores)
+        # All red flags in one pass: an optional lookahead per flag, each scanning the
+        # whole URL, so overlapping flags are all found. A flag's capture group number
+        # skips the groups inside the flags before it, named or not.
+        self.red_flag_groups: list[int] = []
+        parts = []
+        group = 1
+        for pattern in red_flags:
+            self.red_flag_groups.append(group)
+            group += 1 + re.compile(pattern).groups
+            parts.append(f"(?:(?=.*?({pattern})))?")
+        self.red_flag_pattern = re.compile("".join(parts), re.DOTALL) if red_flags else None
+        self._memo: LRUCache = LRUCache(maxsize=memo_size)
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_CREDIBILITY_PATH) -> "CredibilityModel":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(
+            scores={key: float(score) for key, score in data["domains"].items()},
+            red_flags=list(data.get("red_flags", [])),
+            version=str(data.get("version", "")),
+            base_score=float(data.get("base_score", 0.5)),
+            red_flag_penalty=float(data.get("red_flag_penalty", 0.7)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def host_score(self, host: str) -> float:
+        """Score of a host before URL-level adjustments, memoized per host."""
+        score = self._memo.get(host)
+        if score is not None:
+            CREDIBILITY_LOOKUPS.inc(result="hit")
+            return score
+        CREDIBILITY_LOOKUPS.inc(result="miss")
+
+        # Domain-specific scoring first (most specific match), then TLD rules
+        score = self.base_score
+        domain_score, tld_score = self.index.lookup(host)
+        if domain_score is not None:
+            score = domain_score
+        elif tld_score is not None:
+            score = max(score, tld_score)
+        self._memo[host] = score
+        return score
+
+    def red_flag_multiplier(self, url: str) -> float:
+        """Penalty multiplier for the distinct red flags found in `url`."""
+        if self.red_flag_pattern is None:
+            return 1.0
+        match = self.red_flag_pattern.match(url.lower())
+        flags = sum(1 for group in self.red_flag_groups if match.group(group) is not None)
+        return self.red_flag_penalty ** flags
+
+
+class CredibilityModelStore:
+    """
+    Holds the active credibility model and reloads it when its file changes.
+
+    The file's modification time and size are checked at most once per
+    `check_interval` seconds, on the scoring path. Reloading happens on one
+    thread while the others keep scoring with the current model.
+    """
+
+    def __init__(self, path: Path = DEFAULT_CREDIBILITY_PATH, check_interval: float = 5.0):
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self._model: Optional[CredibilityModel] = None
+        self._signature: Optional[tuple[int, int]] = None
+        self._checked_at = 0.0
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _file_signature(self) -> Optional[tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload(self) -> bool:
+        """Load the file now; on failure the previous model stays active."""
+        signature = self._file_signature()
+        try:
+            model = CredibilityModel.load(self.path)
+        except (OSError, ValueError, KeyError, TypeError, re.error) as e:
+            CREDIBILITY_RELOADS.inc(outcome="error")
+            if self._model is None:
+                raise
+            print(f"⚠️ Credibility table reload failed, keeping version {self._model.version}: {e}")
+            self._signature = signature  # Don't retry until the file changes again
+            return False
+
+        previous = self._model
+        self._model = model
+        self._signature = signature
+        self._loaded_at = time.time()
+        CREDIBILITY_RELOADS.inc(outcome="success")
+        CREDIBILITY_TABLE_ENTRIES.set(len(model))
+        if previous is not None:
+            print(f"✓ Credibility table reloaded: version {model.version} ({len(model)} entries)")
+        return True
+
+    def current(self) -> CredibilityModel:
+        """The active model, reloading it first if the file has changed."""
+        now = time.monotonic()
+        if self._model is None or now - self._checked_at >= self.check_interval:
+            # Only one thread checks; the others go on with the current model
+            if self._lock.acquire(blocking=self._model is None):
+                try:
+                    self._checked_at = now
+                    if self._model is None or self._file_signature() != self._signature:
+                        self.reload()
+                finally:
+                    self._lock.release()
+        return self._model
+
+    def stats(self) -> dict[str, Any]:
+        model = self.current()
+        return {
+            "path": str(self.path),
+            "version": model.version,
+            "entries": len(model),
+            "red_flags": len(model.red_flags),
+            "loaded_at": self._loaded_at,
+            "memoized_hosts": len(model._memo),
+        }
+
+
+# Singleton model store
+_credibility_store_instance: Optional[CredibilityModelStore] = None
+
+
+def get_credibility_model_store() -> CredibilityModelStore:
+    """Get the process-wide credibility model store."""
+    global _credibility_store_instance
+    if _credibility_store_instance is None:
+        settings = get_settings()
+        _credibility_store_instance = CredibilityModelStore(
+            path=Path(settings.credibility_table_path or DEFAULT_CREDIBILITY_PATH),
+            check_interval=settings.credibility_reload_seconds,
+        )
+    return _credibility_store_instance
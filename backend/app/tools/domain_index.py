@@ -0,0 +1,145 @@
+"""Domain lookups for credibility scoring.
+
+Hosts are matched against the credibility table label by label, from the
+full host name up to its registrable domain, using hash lookups. The cost
+per URL depends on the number of labels in the host, not on the size of the
+table. Registrable domains are computed with an offline copy of the ICANN
+section of the Public Suffix List (https://publicsuffix.org).
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_PSL_PATH = Path(__file__).parent / "data" / "public_suffix_list.dat"
+
+
+def _to_ascii(name: str) -> Optional[str]:
+    """Punycode-encode internationalized names (None if not encodable)."""
+    if name.isascii():
+        return name
+    prefix = name[0] if name[0] in "!*" else ""
+    try:
+        return prefix + name[len(prefix):].lstrip(".").encode("idna").decode("ascii")
+    except UnicodeError:
+        return None
+
+
+class PublicSuffixList:
+    """Public suffix / registrable domain lookups (exact, wildcard and exception rules)."""
+
+    def __init__(self, rules: set[str], wildcards: set[str], exceptions: set[str]):
+        self.rules = rules
+        self.wildcards = wildcards  # Parents of "*.<parent>" rules
+        self.exceptions = exceptions  # "!<rule>" rules, without the "!"
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_PSL_PATH) -> "PublicSuffixList":
+        rules, wildcards, exceptions = set(), set(), set()
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                rule = line.split(None, 1)[0] if line.strip() else ""
+                if not rule or rule.startswith("//"):
+                    continue
+                rule = _to_ascii(rule.lower())
+                if rule is None:
+                    continue
+                if rule.startswith("!"):
+                    exceptions.add(rule[1:])
+                elif rule.startswith("*."):
+                    wildcards.add(rule[2:])
+                else:
+                    rules.add(rule)
+        return cls(rules, wildcards, exceptions)
+
+    def public_suffix(self, host: str) -> str:
+        """The longest public suffix of `host` ("*" rule: its last label)."""
+        labels = host.split(".")
+        for i in range(len(labels)):
+            suffix = ".".join(labels[i:])
+            if suffix in self.exceptions:
+                return ".".join(labels[i + 1:])
+            parent = ".".join(labels[i + 1:])
+            if suffix in self.rules or (i + 1 < len(labels) and parent in self.wildcards):
+                return suffix
+        return labels[-1]
+
+    def registrable_domain(self, host: str) -> Optional[str]:
+        """The public suffix plus one label, or None if `host` is itself a public suffix."""
+        suffix = self.public_suffix(host)
+        if host == suffix:
+            return None
+        label = host[: -len(suffix) - 1].rsplit(".", 1)[-1]
+        return f"{label}.{suffix}"
+
+
+@lru_cache
+def get_public_suffix_list() -> PublicSuffixList:
+    """Load the bundled Public Suffix List once."""
+    return PublicSuffixList.load()
+
+
+def normalize_host(host: str) -> str:
+    """Lower-case `host` and strip credentials, port, trailing dot and "www."."""
+    host = host.rsplit("@", 1)[-1].lower()
+    if not host.startswith("["):  # Leave IPv6 literals alone
+        host = host.split(":", 1)[0]
+    host = _to_ascii(host.rstrip(".")) or ""
+    return host[4:] if host.startswith("www.") else host
+
+
+class DomainIndex:
+    """
+    Compiled credibility table.
+
+    Keys starting with "." (".edu", ".ac.uk") are suffix rules; all other keys
+    are domains that match themselves and their subdomains. A domain match
+    (the most specific one) takes precedence over a suffix rule (the longest
+    one), as in the original table semantics.
+    """
+
+    def __init__(self, scores: dict[str, float], psl: Optional[PublicSuffixList] = None):
+        self.psl = psl or get_public_suffix_list()
+        self.domains: dict[str, float] = {}
+        self.suffixes: dict[str, float] = {}
+        for key, score in scores.items():
+            key = key.lower()
+            if key.startswith("."):
+                self.suffixes[key[1:]] = score
+            else:
+                self.domains[key] = score
+
+    def __len__(self) -> int:
+        return len(self.domains) + len(self.suffixes)
+
+    def lookup(self, host: str) -> tuple[Optional[float], Optional[float]]:
+        """
+        Scores for `host`: (most specific domain match, longest suffix match).
+
+        Domain entries are only matched down to the host's registrable domain,
+        so an entry that is itself a public suffix never matches as a domain.
+        """
+        host = normalize_host(host)
+        if not host:
+            return None, None
+        labels = host.split(".")
+        registrable = self.psl.registrable_domain(host)
+        # Index of the label where the registrable domain starts
+        floor = len(labels) - registrable.count(".") - 1 if registrable else 0
+
+        domain_score = None
+        if registrable:
+            for i in range(floor + 1):
+                score = self.domains.get(".".join(labels[i:]))
+                if score is not None:
+                    domain_score = score
+                    break
+
+        suffix_score = None
+        for i in range(1, len(labels)):
+            score = self.suffixes.get(".".join(labels[i:]))
+            if score is not None:
+                suffix_score = score
+                break
+
+        return domain_score, suffix_score
@@ -0,0 +1,122 @@
+"""HTML to text conversion, run off the event loop.
+
+Parsing large pages is CPU-bound and would block every SSE stream sharing
+the worker's event loop, so conversion is dispatched to a process pool (or a
+thread pool / inline, for environments where worker processes are not
+available). The conversion itself is done by a pluggable extraction engine.
+"""
+
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Literal, Optional
+
+from app.config import get_settings
+from app.metrics import HTML_PARSE_ACTIVE, HTML_PARSE_LATENCY, HTML_PARSE_QUEUE
+
+ParserBackend = Literal["process", "thread", "inline"]
+
+# An extraction engine turns an HTML document into clean text. Engines run
+# inside pool workers, so they must be picklable module-level functions.
+ExtractionEngine = Callable[[str], str]
+
+
+def _timed(engine: ExtractionEngine, html: str) -> tuple[str, float]:
+    """Run `engine` on `html`, returning the text and the time spent parsing."""
+    start = time.perf_counter()
+    content = engine(html)
+    return content, time.perf_counter() - start
+
+
+class HTMLParserPool:
+    """
+    Dispatches HTML conversion to a worker pool.
+
+    Only the raw HTML goes to the worker and only the cleaned text comes
+    back, keeping the event loop free while pages are parsed. At most
+    `workers` pages are handed to the pool at a time, so the ones waiting
+    for a worker can be told apart from the ones being parsed. A process
+    pool whose worker died is replaced.
+    """
+
+    def __init__(self, backend: ParserBackend = "process", workers: int = 2):
+        self.backend = backend
+        self.workers = workers
+        self._executor: Optional[Executor] = None
+        self._slots = asyncio.Semaphore(workers)
+
+    @property
+    def executor(self) -> Optional[Executor]:
+        """The worker pool, created on first use (None for inline parsing)."""
+        if self._executor is None and self.backend != "inline":
+            if self.backend == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="html-parser"
+                )
+        return self._executor
+
+    async def to_text(self, html: str, engine: ExtractionEngine) -> str:
+        """Convert `html` to text with `engine` without blocking the event loop."""
+        if self.backend == "inline":
+            content, elapsed = _timed(engine, html)
+        else:
+            HTML_PARSE_QUEUE.inc()
+            try:
+                await self._slots.acquire()
+            finally:
+                HTML_PARSE_QUEUE.dec()
+            HTML_PARSE_ACTIVE.inc()
+            try:
+                content, elapsed = await self._run(engine, html)
+            finally:
+                HTML_PARSE_ACTIVE.dec()
+                self._slots.release()
+
+        HTML_PARSE_LATENCY.observe(elapsed, backend=self.backend, engine=engine.__name__)
+        return content
+
+    async def _run(self, engine: ExtractionEngine, html: str) -> tuple[str, float]:
+        """Run `_timed` in the pool, replacing a broken process pool and retrying once."""
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+        try:
+            return await loop.run_in_executor(executor, _timed, engine, html)
+        except BrokenProcessPool:
+            if self._executor is executor:  # Not yet replaced by a concurrent call
+                print("⚠️ HTML parser worker died, restarting the process pool")
+                executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+            return await loop.run_in_executor(self.executor, _timed, engine, html)
+
+    def shutdown(self) -> None:
+        """Stop the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+# Singleton parser pool
+_html_parser_instance: Optional[HTMLParserPool] = None
+
+
+def get_html_parser() -> HTMLParserPool:
+    """Get the shared HTML parser pool."""
+    global _html_parser_instance
+    if _html_parser_instance is None:
+        settings = get_settings()
+        _html_parser_instance = HTMLParserPool(
+            backend=settings.html_parser_backend,
+            workers=settings.html_parser_workers,
+        )
+    return _html_parser_instance
+
+
+def shutdown_html_parser() -> None:
+    """Stop the shared HTML parser pool (called on application shutdown)."""
+    global _html_parser_instance
+    if _html_parser_instance is not None:
+        _html_parser_instance.shutdown()
+        _html_parser_instance = None
@@ -4,10 +4,12 @@ import asyncio
 from typing import Any
 
 import httpx
+from langchain_core.pydantic_v1 import Field
 from langchain_core.tools import BaseTool
-from pydantic import Field
 
 from app.config import get_settings
+from app.http_client import get_http_client
+from app.metrics import TIMEOUTS
 from app.models import Source
 
 
@@ -49,42 +51,42 @@ class WebSearchTool(BaseTool):
                 "num": min(self.max_results, 10),  # Max 10 per request
             }
 
-            async with httpx.AsyncClient(timeout=20.0) as client:
-                response = await client.get(url, params=params)
-                
-                if response.status_code != 200:
-                    error_data = response.json().get("error", {})
-                    error_msg = error_data.get("message", "Unknown error")
-                    error_details = error_data.get("details", [])
-                    print(f"❌ Google API error ({response.status_code}): {error_msg}")
-                    if error_details:
-                        for detail in error_details:
-                            print(f"   Detail: {detail}")
-                    print(f"   API Key (first 10 chars): {settings.google_api_key[:10]}..." if settings.google_api_key else "   API Key: NOT SET")
-                    print(f"   CSE ID: {settings.google_cse_id}" if settings.google_cse_id else "   CSE ID: NOT SET")
-                    return results
-                
-                data = response.json()
-                search_results = data.get("items", [])
-                
-                print(f"📊 Google returned {len(search_results)} results")
-                
-                if not search_results:
-                    print(f"⚠️ Google returned no results for: {query}")
-                    return results
-
-                for item in search_results:
-                    # Only add results with valid URL and title
-                    if item.get("link") and item.get("title"):
-                        results.append({
-                            "url": item.get("link", ""),
-                            "title": item.get("title", ""),
-                            "snippet": item.get("snippet", "")[:500],  # Limit snippet length
-                        })
-                
-                print(f"✓ Processed {len(results)} valid results")
+            response = await get_http_client().get(url, params=params, timeout=20.0)
+
+            if response.status_code != 200:
+                error_data = response.json().get("error", {})
+                error_msg = error_data.get("message", "Unknown error")
+                error_details = error_data.get("details", [])
+                print(f"❌ Google API error ({response.status_code}): {error_msg}")
+                if error_details:
+                    for detail in error_details:
+                        print(f"   Detail: {detail}")
+                print(f"   API Key (first 10 chars): {settings.google_api_key[:10]}..." if settings.google_api_key else "   API Key: NOT SET")
+                print(f"   CSE ID: {settings.google_cse_id}" if settings.google_cse_id else "   CSE ID: NOT SET")
+                return results
+            
+            data = response.json()
+            search_results = data.get("items", [])
+            
+            print(f"📊 Google returned {len(search_results)} results")
+            
+            if not search_results:
+                print(f"⚠️ Google returned no results for: {query}")
+                return results
+
+            for item in search_results:
+                # Only add results with valid URL and title
+                if item.get("link") and item.get("title"):
+                    results.append({
+                        "url": item.get("link", ""),
+                        "title": item.get("title", ""),
+                        "snippet": item.get("snippet", "")[:500],  # Limit snippet length
+                    })
+            
+            print(f"✓ Processed {len(results)} valid results")
 
         except httpx.TimeoutException:
+            TIMEOUTS.inc(target="google_cse")
             print(f"❌ Google search timeout for: {query}")
             return []
         except httpx.RequestError as e:
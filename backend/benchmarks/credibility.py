@@ -0,0 +1,126 @@
+"""Microbenchmark credibility domain lookups on large URL batches.
+
+Compares the compiled per-label index (`DomainIndex`) with the previous
+linear substring scan over the credibility table, for the shipped table and
+for tables padded with synthetic domains.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.credibility --urls 20000 --table-sizes 1000 10000 50000
+"""
+
+import argparse
+import random
+import string
+import time
+from typing import Callable, Optional
+from urllib.parse import urlparse
+
+from app.tools.credibility_filter import CredibilityFilterTool
+from app.tools.credibility_model import CredibilityModel
+from app.tools.domain_index import DomainIndex, get_public_suffix_list
+
+CREDIBILITY_SCORES = CredibilityModel.load().scores
+
+TLDS = ["com", "org", "net", "edu", "gov", "co.uk", "ac.uk", "de", "io", "com.au"]
+
+
+def _random_label(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 12)))
+
+
+def make_table(size: int, rng: random.Random) -> dict[str, float]:
+    """The shipped table padded with synthetic domains up to `size` entries."""
+    table = dict(CREDIBILITY_SCORES)
+    while len(table) < size:
+        table[f"{_random_label(rng)}.{rng.choice(TLDS)}"] = round(rng.uniform(0.2, 0.95), 2)
+    return table
+
+
+def make_urls(count: int, table: dict[str, float], rng: random.Random) -> list[str]:
+    """A mix of known domains, their subdomains and unknown hosts."""
+    domains = [key for key in table if not key.startswith(".")]
+    urls = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.4:
+            host = rng.choice(domains)
+        elif kind < 0.7:
+            host = f"{_random_label(rng)}.{rng.choice(domains)}"
+        else:
+            host = f"www.{_random_label(rng)}.{rng.choice(TLDS)}"
+        urls.append(f"https://{host}/{_random_label(rng)}/{_random_label(rng)}")
+    return urls
+
+
+def linear_lookup(table: dict[str, float]) -> Callable[[str], Optional[float]]:
+    """The previous implementation: substring scan, then TLD scan."""
+
+    def lookup(host: str) -> Optional[float]:
+        for known_domain, domain_score in table.items():
+            if not known_domain.startswith(".") and known_domain in host:
+                return domain_score
+        for tld, tld_score in table.items():
+            if tld.startswith(".") and host.endswith(tld):
+                return tld_score
+        return None
+
+    return lookup
+
+
+def indexed_lookup(table: dict[str, float]) -> Callable[[str], Optional[float]]:
+    index = DomainIndex(table)
+
+    def lookup(host: str) -> Optional[float]:
+        domain_score, suffix_score = index.lookup(host)
+        return domain_score if domain_score is not None else suffix_score
+
+    return lookup
+
+
+def bench(lookup: Callable[[str], Optional[float]], hosts: list[str]) -> float:
+    """Microseconds per host."""
+    start = time.perf_counter()
+    for host in hosts:
+        lookup(host)
+    return (time.perf_counter() - start) / len(hosts) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--urls", type=int, default=20000)
+    parser.add_argument("--table-sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--linear-sample", type=int, default=2000,
+                        help="URLs timed for the (slow) linear scan")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    get_public_suffix_list()  # Load outside the timed sections
+
+    urls = make_urls(args.urls, CREDIBILITY_SCORES, rng)
+    tool = CredibilityFilterTool()
+    start = time.perf_counter()
+    for url in urls:
+        tool._calculate_score(url)
+    per_url = (time.perf_counter() - start) / len(urls) * 1e6
+    print(f"Full score (shipped table, {len(CREDIBILITY_SCORES)} entries): {per_url:.1f} µs/URL")
+
+    # Same URLs again: host base scores now come from the per-host memo
+    start = time.perf_counter()
+    for url in urls:
+        tool._calculate_score(url)
+    per_url = (time.perf_counter() - start) / len(urls) * 1e6
+    print(f"Full score, memoized hosts: {per_url:.1f} µs/URL\n")
+
+    print(f"{'table size':>10}{'linear µs/URL':>16}{'indexed µs/URL':>17}{'speedup':>10}")
+    for size in [len(CREDIBILITY_SCORES), *args.table_sizes]:
+        table = make_table(size, rng)
+        hosts = [urlparse(url).netloc for url in make_urls(args.urls, table, rng)]
+        linear = bench(linear_lookup(table), hosts[: args.linear_sample])
+        indexed = bench(indexed_lookup(table), hosts)
+        print(f"{size:>10}{linear:>16.1f}{indexed:>17.2f}{linear / indexed:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Benchmark content extraction engines on a corpus of saved HTML pages.
+
+Compares CPU time per page and the size of the extracted text (in tokens,
+which is what summarization pays for) across the engines registered in
+`app.tools.content_extractor.EXTRACTION_ENGINES`.
+
+A small fixture corpus (a news article, a blog post, a paper abstract page and
+a documentation page, each with its navigation, ads and footer) is committed
+under `benchmarks/fixtures/` and used by default. Pages fetched with `--fetch`
+are saved to the corpus directory; `benchmarks/pages/` is gitignored for that.
+
+Usage (from the backend directory):
+
+    # Benchmark the fixture corpus
+    python -m benchmarks.extraction
+
+    # Save your own pages, then benchmark every *.html file in them
+    python -m benchmarks.extraction --fetch https://example.com/article ... --corpus benchmarks/pages
+    python -m benchmarks.extraction --corpus benchmarks/pages
+"""
+
+import argparse
+import asyncio
+import hashlib
+import statistics
+import time
+from pathlib import Path
+from typing import Callable
+
+import httpx
+
+from app.tools.content_extractor import EXTRACTION_ENGINES
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _token_counter() -> Callable[[str], int]:
+    try:
+        import tiktoken
+
+        encoding = tiktoken.get_encoding("cl100k_base")
+        return lambda text: len(encoding.encode(text, disallowed_special=()))
+    except Exception:
+        print("⚠️ tiktoken unavailable, estimating tokens as characters / 4")
+        return lambda text: len(text) // 4
+
+
+async def fetch_corpus(urls: list[str], corpus: Path) -> None:
+    """Download `urls` into `corpus` as <sha1>.html files."""
+    corpus.mkdir(parents=True, exist_ok=True)
+    async with httpx.AsyncClient(timeout=20.0, follow_redirects=True) as client:
+        for url in urls:
+            try:
+                response = await client.get(url, headers={"User-Agent": "Mozilla/5.0"})
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                print(f"❌ {url}: {e}")
+                continue
+            name = hashlib.sha1(url.encode()).hexdigest()[:16] + ".html"
+            (corpus / name).write_text(response.text, encoding="utf-8")
+            print(f"✓ {url} -> {name} ({len(response.text) // 1024} KB)")
+
+
+def run(corpus: Path, engines: list[str], repeat: int, max_content_length: int) -> None:
+    pages = sorted(corpus.glob("*.html"))
+    if not pages:
+        raise SystemExit(f"No *.html pages in {corpus}")
+
+    count_tokens = _token_counter()
+    html_pages = [page.read_text(encoding="utf-8", errors="replace") for page in pages]
+    print(f"Corpus: {len(pages)} pages, {sum(map(len, html_pages)) // 1024} KB of HTML\n")
+    print(f"{'engine':<14}{'ms/page (median)':>18}{'ms/page (mean)':>16}{'tokens/page':>14}{'empty':>8}")
+
+    for name in engines:
+        engine = EXTRACTION_ENGINES[name]
+        timings, tokens, empty = [], [], 0
+        for html in html_pages:
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.process_time()
+                content = engine(html)
+                best = min(best, time.process_time() - start)
+            timings.append(best * 1000)
+            # The tool truncates long pages before summarization
+            content = content.strip()[:max_content_length]
+            tokens.append(count_tokens(content))
+            empty += not content
+
+        print(
+            f"{name:<14}{statistics.median(timings):>18.1f}{statistics.mean(timings):>16.1f}"
+            f"{statistics.mean(tokens):>14.0f}{empty:>8}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, default=FIXTURES)
+    parser.add_argument("--fetch", nargs="+", metavar="URL", help="Save these pages into the corpus first")
+    parser.add_argument("--engines", nargs="+", default=list(EXTRACTION_ENGINES), choices=list(EXTRACTION_ENGINES))
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per page; the fastest is kept")
+    parser.add_argument("--max-content-length", type=int, default=15000)
+    args = parser.parse_args()
+
+    if args.fetch:
+        asyncio.run(fetch_corpus(args.fetch, args.corpus))
+    run(args.corpus, args.engines, args.repeat, args.max_content_length)
+
+
+if __name__ == "__main__":
+    main()